@@ -177,11 +177,11 @@ def check_with_ngram(sentence: str, ngram_order: int, probability_threshold: flo
                 candidate_words = [c[0] for c in raw_candidates]
                 if not candidate_words: continue
 
-                best_candidates = scorer.rank_candidates(candidate_words, context, original_word=word)
+                # The ranking already scored the top candidate; reuse that score
+                best_candidates = scorer.score_candidates(candidate_words, context, original_word=word)
                 if best_candidates:
-                    top_word = best_candidates[0]
+                    top_word, new_score = best_candidates[0]
                     current_score = scorer.score_candidate(word, context, original_word=word)
-                    new_score = scorer.score_candidate(top_word, context, original_word=word)
                     
                     if top_word.lower() != word.lower() and new_score > current_score * 1.5:
                         original_text = sentence[start:end]
@@ -0,0 +1,115 @@
+"""
+Verb table for the rule-based grammar checker.
+Kept out of grammar_rules so it is only loaded when a checker is first built.
+"""
+
+# Universal Verb Forms (Base -> (Past, Past Participle, 3rd Person, Participle))
+VERB_FORMS = {
+    'buy': ('bought', 'bought', 'buys', 'buying'),
+    'go': ('went', 'gone', 'goes', 'going'),
+    'get': ('got', 'gotten', 'gets', 'getting'),
+    'make': ('made', 'made', 'makes', 'making'),
+    'know': ('knew', 'known', 'knows', 'knowing'),
+    'think': ('thought', 'thought', 'thinks', 'thinking'),
+    'take': ('took', 'taken', 'takes', 'taking'),
+    'see': ('saw', 'seen', 'sees', 'seeing'),
+    'come': ('came', 'come', 'comes', 'coming'),
+    'want': ('wanted', 'wanted', 'wants', 'wanting'),
+    'look': ('looked', 'looked', 'looks', 'looking'),
+    'use': ('used', 'used', 'uses', 'using'),
+    'find': ('found', 'found', 'finds', 'finding'),
+    'give': ('gave', 'given', 'gives', 'giving'),
+    'tell': ('told', 'told', 'tells', 'telling'),
+    'work': ('worked', 'worked', 'works', 'working'),
+    'try': ('tried', 'tried', 'tries', 'trying'),
+    'ask': ('asked', 'asked', 'asks', 'asking'),
+    'need': ('needed', 'needed', 'needs', 'needing'),
+    'feel': ('felt', 'felt', 'feels', 'feeling'),
+    'leave': ('left', 'left', 'leaves', 'leaving'),
+    'put': ('put', 'put', 'puts', 'putting'),
+    'mean': ('meant', 'meant', 'means', 'meaning'),
+    'keep': ('kept', 'kept', 'keeps', 'keeping'),
+    'let': ('let', 'let', 'lets', 'letting'),
+    'begin': ('began', 'begun', 'begins', 'beginning'),
+    'help': ('helped', 'helped', 'helps', 'helping'),
+    'talk': ('talked', 'talked', 'talks', 'talking'),
+    'start': ('started', 'started', 'starts', 'starting'),
+    'show': ('showed', 'shown', 'shows', 'showing'),
+    'hear': ('heard', 'heard', 'hears', 'hearing'),
+    'play': ('played', 'played', 'plays', 'playing'),
+    'run': ('ran', 'run', 'runs', 'running'),
+    'move': ('moved', 'moved', 'moves', 'moving'),
+    'like': ('liked', 'liked', 'likes', 'liking'),
+    'live': ('lived', 'lived', 'lives', 'living'),
+    'believe': ('believed', 'believed', 'believes', 'believing'),
+    'hold': ('held', 'held', 'holds', 'holding'),
+    'bring': ('brought', 'brought', 'brings', 'bringing'),
+    'happen': ('happened', 'happened', 'happens', 'happening'),
+    'write': ('wrote', 'written', 'writes', 'writing'),
+    'provide': ('provided', 'provided', 'provides', 'providing'),
+    'sit': ('sat', 'sat', 'sits', 'sitting'),
+    'stand': ('stood', 'stood', 'stands', 'standing'),
+    'lose': ('lost', 'lost', 'loses', 'losing'),
+    'pay': ('paid', 'paid', 'pays', 'paying'),
+    'meet': ('met', 'met', 'meets', 'meeting'),
+    'learn': ('learned', 'learned', 'learns', 'learning'),
+    'change': ('changed', 'changed', 'changes', 'changing'),
+    'lead': ('led', 'led', 'leads', 'leading'),
+    'understand': ('understood', 'understood', 'understands', 'understanding'),
+    'watch': ('watched', 'watched', 'watches', 'watching'),
+    'follow': ('followed', 'followed', 'follows', 'following'),
+    'stop': ('stopped', 'stopped', 'stops', 'stopping'),
+    'create': ('created', 'created', 'creates', 'creating'),
+    'speak': ('spoke', 'spoken', 'speaks', 'speaking'),
+    'read': ('read', 'read', 'reads', 'reading'),
+    'allow': ('allowed', 'allowed', 'allows', 'allowing'),
+    'add': ('added', 'added', 'adds', 'adding'),
+    'spend': ('spent', 'spent', 'spends', 'spending'),
+    'grow': ('grew', 'grown', 'grows', 'growing'),
+    'open': ('opened', 'opened', 'opens', 'opening'),
+    'walk': ('walked', 'walked', 'walks', 'walking'),
+    'win': ('won', 'won', 'wins', 'winning'),
+    'offer': ('offered', 'offered', 'offers', 'offering'),
+    'remember': ('remembered', 'remembered', 'remembers', 'remembering'),
+    'love': ('loved', 'loved', 'loves', 'loving'),
+    'consider': ('considered', 'considered', 'considers', 'considering'),
+    'appear': ('appeared', 'appeared', 'appears', 'appearing'),
+    'wait': ('waited', 'waited', 'waits', 'waiting'),
+    'serve': ('served', 'served', 'serves', 'serving'),
+    'die': ('died', 'died', 'dies', 'dying'),
+    'send': ('sent', 'sent', 'sends', 'sending'),
+    'expect': ('expected', 'expected', 'expects', 'expecting'),
+    'build': ('built', 'built', 'builds', 'building'),
+    'stay': ('stayed', 'stayed', 'stays', 'staying'),
+    'fall': ('fell', 'fallen', 'falls', 'falling'),
+    'cut': ('cut', 'cut', 'cuts', 'cutting'),
+    'reach': ('reached', 'reached', 'reaches', 'reaching'),
+    'kill': ('killed', 'killed', 'kills', 'killing'),
+    'remain': ('remained', 'remained', 'remains', 'remaining'),
+    'plan': ('planned', 'planned', 'plans', 'planning'),
+    'study': ('studied', 'studied', 'studies', 'studying'),
+    'listen': ('listened', 'listened', 'listens', 'listening'),
+    'forget': ('forgot', 'forgotten', 'forgets', 'forgetting'),
+    'decide': ('decided', 'decided', 'decides', 'deciding'),
+    'hope': ('hoped', 'hoped', 'hopes', 'hoping'),
+    'visit': ('visited', 'visited', 'visits', 'visiting'),
+    'travel': ('traveled', 'traveled', 'travels', 'traveling'),
+    'worry': ('worried', 'worried', 'worries', 'worrying'),
+    'clean': ('cleaned', 'cleaned', 'cleans', 'cleaning'),
+    'cook': ('cooked', 'cooked', 'cooks', 'cooking'),
+    'wash': ('washed', 'washed', 'washes', 'washing'),
+    'fix': ('fixed', 'fixed', 'fixes', 'fixing'),
+    'rain': ('rained', 'rained', 'rains', 'raining'),
+    'snow': ('snowed', 'snowed', 'snows', 'snowing'),
+    'relax': ('relaxed', 'relaxed', 'relaxes', 'relaxing'),
+    'finish': ('finished', 'finished', 'finishes', 'finishing'),
+    'explain': ('explained', 'explained', 'explains', 'explaining'),
+    'wear': ('wore', 'worn', 'wears', 'wearing'),
+    'drink': ('drank', 'drunk', 'drinks', 'drinking'),
+    'eat': ('ate', 'eaten', 'eats', 'eating'),
+    'drive': ('drove', 'driven', 'drives', 'driving'),
+    'prepare': ('prepared', 'prepared', 'prepares', 'preparing'),
+    'wake': ('woke', 'woken', 'wakes', 'waking'),
+    'drain': ('drained', 'drained', 'drains', 'draining'),
+    'arrive': ('arrived', 'arrived', 'arrives', 'arriving'),
+}
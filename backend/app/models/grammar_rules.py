@@ -4,22 +4,137 @@ Advanced logic for paragraph-level consistency and complex grammar rules.
 """
 
 import re
-from typing import List, Dict, Tuple
+import sys
+import functools
+import itertools
+from typing import List, Dict, Tuple, NamedTuple, Optional
+
+
+class RuleError:
+    """
+    Compact error record emitted by the rule checks.
+    Converted to the API dict shape once, at the check_text() boundary.
+    """
+    __slots__ = ('type', 'start', 'end', 'original', 'suggestion', 'explanation', 'sentenceIndex')
+    
+    def __init__(self, type: str, start: int, end: int, original: str, suggestion: str, explanation: str, sentenceIndex: int = 0):
+        self.type = type
+        self.start = start
+        self.end = end
+        self.original = original
+        self.suggestion = suggestion
+        self.explanation = explanation
+        self.sentenceIndex = sentenceIndex
+    
+    def to_dict(self) -> Dict:
+        return {
+            'type': self.type,
+            'position': {'start': self.start, 'end': self.end},
+            'original': self.original,
+            'suggestion': self.suggestion,
+            'explanation': self.explanation,
+            'sentenceIndex': self.sentenceIndex,
+        }
+
+
+# Token role bits: which per-token rules a vocabulary word can trigger
+_ROLE_MORPHOLOGY = 1 << 0
+_ROLE_APOSTROPHE = 1 << 1
+_ROLE_CONTRACTION = 1 << 2
+_ROLE_BE_VERB = 1 << 3
+_ROLE_IT = 1 << 4
+_ROLE_VERB_BASE = 1 << 5
+_ROLE_VERB_FORM = 1 << 6
+_ROLE_FAMILY = 1 << 7
+_ROLE_EXPLAIN = 1 << 8
+_ROLE_GO = 1 << 9
+_ROLE_ADJECTIVE = 1 << 10
+
+
+class _TokenInfo(NamedTuple):
+    """Precomputed per-word payload for the token rules (None where a slot does not apply)."""
+    fix: Optional[str]          # MORPHOLOGY_FIXES
+    apostrophe: Optional[str]   # CONTRACTION_FIXES
+    contraction: Optional[str]  # SIMPLE_CONTRACTIONS
+    base: Optional[str]         # base form of any known verb form
+    past: Optional[str]         # past form to suggest for a verb base (None: be/have, or base is already past)
+    adverb: Optional[str]       # ADJ_TO_ADV
+
+
+class _TextContext:
+    """Everything derived once from the input text and shared by the rule checks."""
+    __slots__ = ('text', 'text_lower', 'wtokens', 'wstarts', 'wends', 'woriginals', 'hits', 'phrase_hits', 'past_context')
+    
+    def __init__(self, text: str, text_lower: str, wtokens: List[str], wstarts: List[int], wends: List[int], woriginals: List[str],
+                 hits: List[Tuple[int, int, _TokenInfo]], phrase_hits: Dict[str, List[int]], past_context: bool):
+        self.text = text
+        self.text_lower = text_lower
+        # Parallel token lists: lowercased words, starts, ends, original spellings
+        self.wtokens = wtokens
+        self.wstarts = wstarts
+        self.wends = wends
+        self.woriginals = woriginals
+        self.hits = hits
+        self.phrase_hits = phrase_hits
+        self.past_context = past_context
+
+
+# Rule patterns, compiled once at import
+_LETTER_RE = re.compile(r'[^\W\d_]')
+_TOKEN_RE = re.compile(r"\b\w+(?:'\w+)?\b")
+_FIRST_LOWER_RE = re.compile(r'^\s*([a-z])')
+_SENTENCE_START_RE = re.compile(r'([.!?]\s+)([a-z])')
+_LEADING_NO_ENOUGH_RE = re.compile(r'^\s*(no)\s+enough\b', re.IGNORECASE | re.MULTILINE)
+_INNER_NO_ENOUGH_RE = re.compile(r'(?<!^)\s+(no)\s+enough\b', re.IGNORECASE)
+# Lowercase pronoun "i" only (already-capital "I" needs no fix); "i'm" is a contraction
+_LOWER_I_RE = re.compile(r"\bi\b(?!')")
+
+
+# Lookup sets used inside the rules, built once at import
+_VERBS_AFTER_ITS = frozenset({'is', 'are', 'was', 'were', 'has', 'have', 'had', 'will', 'would', 'could', 'should', 'might', 'been', 'being', 'raining', 'going', 'coming', 'getting', 'looking', 'working', 'making', 'taking', 'doing', 'saying'})
+_SVA_ADVERBS = frozenset({'already', 'just', 'always', 'never', 'really', 'often'})
+_MANNER_VERBS = frozenset({'run', 'runs', 'ran', 'walk', 'walks', 'walked', 'speak', 'spoke', 'speaks', 'sing', 'sang', 'arrive', 'arrived'})
+_POSS_NOUNS = frozenset({'battery', 'phone', 'car'})
+_GO_EXCEPTIONS = frozenset({'to', 'into', 'in', 'out', 'up', 'down', 'back', 'on', 'home', 'away'})
+_ZERO_ARTICLE = frozenset({'work', 'school', 'bed', 'church', 'college', 'jail'})
+_DEFINITE = frozenset({'library', 'mall', 'park', 'cinema', 'gym', 'bank'})
+_DID_FORMS = frozenset({'did', 'didnt', "didn't"})
+_MODALS = frozenset({'to', 'can', 'could', 'will', 'would', 'should', 'may', 'might', 'must', 'do', 'does'})
+# Real '-ed' words that look like a regularized irregular past ('planed' a board, 'putted' on a green)
+_REAL_ED_WORDS = frozenset({'planed', 'leaded', 'putted', 'readded', 'leaved'})
+_CAUSATIVES = frozenset({'help', 'helped', 'helps', 'make', 'made', 'makes', 'let', 'lets', 'see', 'saw', 'watch', 'watched', 'hear', 'heard'})
+_BE_HAVE = frozenset({'be', 'is', 'are', 'was', 'were', 'have', 'has', 'had'})
+_EXPLAIN_OBJECTS = frozenset({'him', 'her', 'me', 'us', 'them', 'you'})
+_NOT_POSSESSED = frozenset({'was', 'is', 'said', 'went', 'told', 'asked', 'with', 'from', 'to'})
+_ADJ_EXCLUDE_ER = frozenset({'never', 'ever', 'over', 'under', 'river', 'paper', 'water', 'corner', 'father', 'mother', 'brother', 'sister', 'summer', 'winter', 'dinner', 'offer', 'answer'})
+# "more <x>er", with the nouns above rejected inside the pattern itself
+_DOUBLE_COMPARATIVE_RE = re.compile(r'\bmore\s+(?!(?:%s)\b)([a-z]+er)\b' % '|'.join(sorted(_ADJ_EXCLUDE_ER)), re.IGNORECASE)
+
+
+# Subject number for agreement checks
+_SUBJECT_SINGULAR = 1
+_SUBJECT_PLURAL = 2
+
+
+def _intern_keys(table: Dict) -> Dict:
+    """Intern table keys so lookups with interned tokens hit the identity fast path."""
+    return {sys.intern(k): v for k, v in table.items()}
+
 
 class GrammarRulesChecker:
     
     # 1. Common Morphology Errors (Grammar masquerading as spelling)
-    MORPHOLOGY_FIXES = {
+    MORPHOLOGY_FIXES = _intern_keys({
         'buyed': 'bought', 'goed': 'went', 'taked': 'took', 'comed': 'came', 
         'runned': 'ran', 'eated': 'ate', 'drinked': 'drank', 'seed': 'saw',
         'thinked': 'thought', 'finded': 'found', 'keeped': 'kept', 'sleebed': 'slept',
         'payed': 'paid', 'sayed': 'said', 'maked': 'made', 'writed': 'wrote',
         'readed': 'read', 'speaked': 'spoke', 'breaked': 'broke', 'wakup': 'woke up',
         'wake': 'woke', 'waked': 'woke', 'phne': 'phone' # Common typos contextually handled
-    }
+    })
     
     # 1b. Missing Apostrophe Contractions
-    CONTRACTION_FIXES = {
+    CONTRACTION_FIXES = _intern_keys({
         'dont': "don't", 'doesnt': "doesn't", 'didnt': "didn't",
         'wont': "won't", 'cant': "can't", 'shouldnt': "shouldn't",
         'wouldnt': "wouldn't", 'couldnt': "couldn't", 'isnt': "isn't",
@@ -33,7 +148,7 @@ class GrammarRulesChecker:
         'thats': "that's", 'whats': "what's", 'whos': "who's",
         'lets': "let's", 'theres': "there's", 'heres': "here's",
         'aint': "ain't", 'mustnt': "mustn't", 'mightnt': "mightn't"
-    }
+    })
 
     # 2. Strong Past Tense Indicators
     STRONG_PAST_VERBS = {
@@ -43,117 +158,7 @@ class GrammarRulesChecker:
         'woke', 'prepared', 'forgot'
     }
 
-    # 3. Universal Verb Forms (Base -> (Past, Past Participle, 3rd Person, Participle))
-    VERB_FORMS = {
-        'buy': ('bought', 'bought', 'buys', 'buying'),
-        'go': ('went', 'gone', 'goes', 'going'),
-        'get': ('got', 'gotten', 'gets', 'getting'),
-        'make': ('made', 'made', 'makes', 'making'),
-        'know': ('knew', 'known', 'knows', 'knowing'),
-        'think': ('thought', 'thought', 'thinks', 'thinking'),
-        'take': ('took', 'taken', 'takes', 'taking'),
-        'see': ('saw', 'seen', 'sees', 'seeing'),
-        'come': ('came', 'come', 'comes', 'coming'),
-        'want': ('wanted', 'wanted', 'wants', 'wanting'),
-        'look': ('looked', 'looked', 'looks', 'looking'),
-        'use': ('used', 'used', 'uses', 'using'),
-        'find': ('found', 'found', 'finds', 'finding'),
-        'give': ('gave', 'given', 'gives', 'giving'),
-        'tell': ('told', 'told', 'tells', 'telling'),
-        'work': ('worked', 'worked', 'works', 'working'),
-        'try': ('tried', 'tried', 'tries', 'trying'),
-        'ask': ('asked', 'asked', 'asks', 'asking'),
-        'need': ('needed', 'needed', 'needs', 'needing'),
-        'feel': ('felt', 'felt', 'feels', 'feeling'),
-        'leave': ('left', 'left', 'leaves', 'leaving'),
-        'put': ('put', 'put', 'puts', 'putting'),
-        'mean': ('meant', 'meant', 'means', 'meaning'),
-        'keep': ('kept', 'kept', 'keeps', 'keeping'),
-        'let': ('let', 'let', 'lets', 'letting'),
-        'begin': ('began', 'begun', 'begins', 'beginning'),
-        'help': ('helped', 'helped', 'helps', 'helping'),
-        'talk': ('talked', 'talked', 'talks', 'talking'),
-        'start': ('started', 'started', 'starts', 'starting'),
-        'show': ('showed', 'shown', 'shows', 'showing'),
-        'hear': ('heard', 'heard', 'hears', 'hearing'),
-        'play': ('played', 'played', 'plays', 'playing'),
-        'run': ('ran', 'run', 'runs', 'running'),
-        'move': ('moved', 'moved', 'moves', 'moving'),
-        'like': ('liked', 'liked', 'likes', 'liking'),
-        'live': ('lived', 'lived', 'lives', 'living'),
-        'believe': ('believed', 'believed', 'believes', 'believing'),
-        'hold': ('held', 'held', 'holds', 'holding'),
-        'bring': ('brought', 'brought', 'brings', 'bringing'),
-        'happen': ('happened', 'happened', 'happens', 'happening'),
-        'write': ('wrote', 'written', 'writes', 'writing'),
-        'provide': ('provided', 'provided', 'provides', 'providing'),
-        'sit': ('sat', 'sat', 'sits', 'sitting'),
-        'stand': ('stood', 'stood', 'stands', 'standing'),
-        'lose': ('lost', 'lost', 'loses', 'losing'),
-        'pay': ('paid', 'paid', 'pays', 'paying'),
-        'meet': ('met', 'met', 'meets', 'meeting'),
-        'learn': ('learned', 'learned', 'learns', 'learning'),
-        'change': ('changed', 'changed', 'changes', 'changing'),
-        'lead': ('led', 'led', 'leads', 'leading'),
-        'understand': ('understood', 'understood', 'understands', 'understanding'),
-        'watch': ('watched', 'watched', 'watches', 'watching'),
-        'follow': ('followed', 'followed', 'follows', 'following'),
-        'stop': ('stopped', 'stopped', 'stops', 'stopping'),
-        'create': ('created', 'created', 'creates', 'creating'),
-        'speak': ('spoke', 'spoken', 'speaks', 'speaking'),
-        'read': ('read', 'read', 'reads', 'reading'),
-        'allow': ('allowed', 'allowed', 'allows', 'allowing'),
-        'add': ('added', 'added', 'adds', 'adding'),
-        'spend': ('spent', 'spent', 'spends', 'spending'),
-        'grow': ('grew', 'grown', 'grows', 'growing'),
-        'open': ('opened', 'opened', 'opens', 'opening'),
-        'walk': ('walked', 'walked', 'walks', 'walking'),
-        'win': ('won', 'won', 'wins', 'winning'),
-        'offer': ('offered', 'offered', 'offers', 'offering'),
-        'remember': ('remembered', 'remembered', 'remembers', 'remembering'),
-        'love': ('loved', 'loved', 'loves', 'loving'),
-        'consider': ('considered', 'considered', 'considers', 'considering'),
-        'appear': ('appeared', 'appeared', 'appears', 'appearing'),
-        'buy': ('bought', 'bought', 'buys', 'buying'),
-        'wait': ('waited', 'waited', 'waits', 'waiting'),
-        'serve': ('served', 'served', 'serves', 'serving'),
-        'die': ('died', 'died', 'dies', 'dying'),
-        'send': ('sent', 'sent', 'sends', 'sending'),
-        'expect': ('expected', 'expected', 'expects', 'expecting'),
-        'build': ('built', 'built', 'builds', 'building'),
-        'stay': ('stayed', 'stayed', 'stays', 'staying'),
-        'fall': ('fell', 'fallen', 'falls', 'falling'),
-        'cut': ('cut', 'cut', 'cuts', 'cutting'),
-        'reach': ('reached', 'reached', 'reaches', 'reaching'),
-        'kill': ('killed', 'killed', 'kills', 'killing'),
-        'remain': ('remained', 'remained', 'remains', 'remaining'),
-        'plan': ('planned', 'planned', 'plans', 'planning'),
-        'study': ('studied', 'studied', 'studies', 'studying'),
-        'listen': ('listened', 'listened', 'listens', 'listening'),
-        'forget': ('forgot', 'forgotten', 'forgets', 'forgetting'),
-        'decide': ('decided', 'decided', 'decides', 'deciding'),
-        'hope': ('hoped', 'hoped', 'hopes', 'hoping'),
-        'visit': ('visited', 'visited', 'visits', 'visiting'),
-        'travel': ('traveled', 'traveled', 'travels', 'traveling'),
-        'worry': ('worried', 'worried', 'worries', 'worrying'),
-        'clean': ('cleaned', 'cleaned', 'cleans', 'cleaning'),
-        'cook': ('cooked', 'cooked', 'cooks', 'cooking'),
-        'wash': ('washed', 'washed', 'washes', 'washing'),
-        'fix': ('fixed', 'fixed', 'fixes', 'fixing'),
-        'rain': ('rained', 'rained', 'rains', 'raining'),
-        'snow': ('snowed', 'snowed', 'snows', 'snowing'),
-        'relax': ('relaxed', 'relaxed', 'relaxes', 'relaxing'),
-        'finish': ('finished', 'finished', 'finishes', 'finishing'),
-        'explain': ('explained', 'explained', 'explains', 'explaining'),
-        'wear': ('wore', 'worn', 'wears', 'wearing'),
-        'drink': ('drank', 'drunk', 'drinks', 'drinking'),
-        'eat': ('ate', 'eaten', 'eats', 'eating'),
-        'drive': ('drove', 'driven', 'drives', 'driving'),
-        'prepare': ('prepared', 'prepared', 'prepares', 'preparing'),
-        'wake': ('woke', 'woken', 'wakes', 'waking'),
-        'drain': ('drained', 'drained', 'drains', 'draining'),
-        'arrive': ('arrived', 'arrived', 'arrives', 'arriving'),
-    }
+    # 3. Universal Verb Forms: see grammar_data.VERB_FORMS, loaded per checker in __init__
     
     SINGULAR_SUBJECTS = {
         'he', 'she', 'it', 'this', 'that', 'everyone', 'someone', 'anyone',
@@ -166,320 +171,405 @@ class GrammarRulesChecker:
     
     POSSESSIVE_MAP = {'it': 'its', 'he': 'his', 'she': 'her', 'they': 'their', 'we': 'our', 'i': 'my', 'you': 'your'}
     
+    BE_PLURAL_FIX = {'is': 'are', 'was': 'were'}
+    BE_SINGULAR_FIX = {'are': 'is', 'were': 'was'}
+    
+    SIMPLE_CONTRACTIONS = {'dont': "don't", 'didnt': "didn't", 'cant': "can't", 'im': "I'm", 'its': "it's"}
+    
+    FAMILY_NOUNS = {'mother', 'father', 'brother', 'sister', 'aunt', 'uncle', 'friend', 'neighbor', 'teacher', 'student'}
+    
+    ADJ_TO_ADV = {'quick': 'quickly', 'slow': 'slowly', 'loud': 'loudly', 'quiet': 'quietly', 'bad': 'badly'}
+    
+    # Words that put the whole text in past context
+    PAST_INDICATORS = frozenset({'yesterday', 'ago', 'last', 'previously', 'before', 'already'})
+    
+    # Fixed phrases matched as substrings of the lowered text
+    PREPOSITION_FIXES = {'married with': 'married to', 'good in': 'good at', 'angry to': 'angry with', 'depend of': 'depend on', 'listen her': 'listen to her', 'arrive to': 'arrive at'}
+    REDUNDANT_PHRASES = {'return back': 'return', 'repeat again': 'repeat', 'reply back': 'reply', 'join together': 'join'}
+    
+    # Number of distinct texts whose results are memoized per checker
+    CACHE_SIZE = 1024
+    
     def __init__(self):
-        self.verb_base_lookup = {}
+        # The verb table is the bulk of the rule data; import it on first construction
+        from app.models.grammar_data import VERB_FORMS
+        self.VERB_FORMS = _intern_keys(VERB_FORMS)
+        
+        # Every surface form -> (base, base's past, is_base, is_past); a base always
+        # maps to itself, any other form to the first verb that lists it
+        self.form_info: Dict[str, Tuple[str, str, bool, bool]] = {
+            base: (base, forms[0], True, base == forms[0]) for base, forms in self.VERB_FORMS.items()
+        }
         for base, forms in self.VERB_FORMS.items():
-            self.verb_base_lookup[base] = base
             for form in forms:
-                if form not in self.verb_base_lookup:
-                    self.verb_base_lookup[form] = base
-    
-    def check_text(self, text: str) -> List[Dict]:
-        errors = []
+                if form not in self.form_info:
+                    self.form_info[form] = (base, forms[0], False, form == forms[0])
         
-        # 1. Detect Context
-        past_indicators = {'yesterday', 'ago', 'last', 'previously', 'before', 'already'}
-        text_lower = text.lower()
-        has_keyword = any(ind in text_lower for ind in past_indicators)
-        has_past_verb = any(word in self.STRONG_PAST_VERBS for word in text_lower.split())
-        global_past_context = has_keyword or has_past_verb
+        # Flat per-slot views of VERB_FORMS: one dict probe instead of probe + tuple index
+        self.verb_bases = frozenset(self.VERB_FORMS)
+        self.past_forms = {base: forms[0] for base, forms in self.VERB_FORMS.items()}
+        self.past_participles = {base: forms[1] for base, forms in self.VERB_FORMS.items()}
+        # Bases that double as one of their own inflections ('put', 'read', 'come')
+        self.self_inflected_verbs = frozenset(base for base, forms in self.VERB_FORMS.items() if base in forms)
+        # Only the inflected forms: the words the "to + verb" rule can correct
+        self._nonbase_to_base: Dict[str, str] = {
+            form: base for form, (base, _, is_base, _) in self.form_info.items() if not is_base
+        }
         
-        # 2. Tokenize
-        errors.extend(self._check_sentence_capitalization(text))
-        words = self._tokenize(text)
+        # word -> (bitmask of the per-token rules it can trigger, payload for those rules);
+        # one probe per token replaces the separate per-rule dict/set lookups
+        masks: Dict[str, int] = {}
+        for words, role in (
+            (self.MORPHOLOGY_FIXES, _ROLE_MORPHOLOGY),
+            (('its', *self.CONTRACTION_FIXES), _ROLE_APOSTROPHE),
+            (self.SIMPLE_CONTRACTIONS, _ROLE_CONTRACTION),
+            ((*self.BE_PLURAL_FIX, *self.BE_SINGULAR_FIX), _ROLE_BE_VERB),
+            (('it',), _ROLE_IT),
+            (self.verb_bases, _ROLE_VERB_BASE),
+            (self._nonbase_to_base, _ROLE_VERB_FORM),
+            (self.FAMILY_NOUNS, _ROLE_FAMILY),
+            (('explain', 'explained'), _ROLE_EXPLAIN),
+            (('go', 'goes', 'went', 'going'), _ROLE_GO),
+            (self.ADJ_TO_ADV, _ROLE_ADJECTIVE),
+        ):
+            for word in words:
+                word = sys.intern(word)
+                masks[word] = masks.get(word, 0) | role
+        no_form = (None, None, False, False)
+        self._token_roles: Dict[str, Tuple[int, _TokenInfo]] = {}
+        for word, mask in masks.items():
+            base, past, is_base, _ = self.form_info.get(word, no_form)
+            self._token_roles[word] = (mask, _TokenInfo(
+                self.MORPHOLOGY_FIXES.get(word),
+                self.CONTRACTION_FIXES.get(word),
+                self.SIMPLE_CONTRACTIONS.get(word),
+                base,
+                past if is_base and word != past and word not in _BE_HAVE else None,
+                self.ADJ_TO_ADV.get(word),
+            ))
         
-        # 3. Apply Checks
-        errors.extend(self._check_morphology(text, words, global_past_context))
-        errors.extend(self._check_missing_apostrophes(text, words))
-        errors.extend(self._check_quantifiers(text, words))
-        errors.extend(self._check_double_comparatives(text, words))
-        errors.extend(self._check_explain_errors(text, words))
-        errors.extend(self._check_redundancy(text, words))
-        errors.extend(self._check_possessives_context(text, words))
+        # Subject word -> number; a word listed in both tables counts as plural
+        self._subject_kind: Dict[str, int] = _intern_keys({
+            **{word: _SUBJECT_SINGULAR for word in self.SINGULAR_SUBJECTS},
+            **{word: _SUBJECT_PLURAL for word in self.PLURAL_SUBJECTS},
+        })
         
-        errors.extend(self._check_contractions(text, words))
-        errors.extend(self._check_subject_verb_agreement(text, words))
-        errors.extend(self._check_possessive_pronouns(text, words))
-        errors.extend(self._check_verb_tense(text, words, force_past=global_past_context))
-        errors.extend(self._check_progressive_tense(text, words))
-        errors.extend(self._check_say_to_tell(text, words))
-        errors.extend(self._check_past_tense_after_conjunction(text, words))
-        errors.extend(self._check_gerund_patterns(text, words))
-        errors.extend(self._check_plural_nouns(text, words))
-        errors.extend(self._check_pronoun_capitalization(text, words))
-        errors.extend(self._check_infinitive_patterns(text, words))
-        errors.extend(self._check_to_verb_form(text, words))
-        errors.extend(self._check_articles(text, words))
-        errors.extend(self._check_adverbs(text, words))
-        errors.extend(self._check_prepositions(text, words))
-        errors.extend(self._check_confused_words(text, words))
-        errors.extend(self._check_prepositions_context(text, words))
+        # Every phrase the substring rules look for, found once per text and shared by those rules
+        self._phrases = (*self.PREPOSITION_FIXES, *self.REDUNDANT_PHRASES)
         
-        return errors
+        # Results are a pure function of the text; repeated checks of the same
+        # input (re-renders, retries) are served from this cache
+        self._check_text_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._check_text_uncached)
     
-    def _tokenize(self, text: str) -> List[Tuple[str, int, int]]:
-        tokens = []
-        for match in re.finditer(r"\b\w+(?:'\w+)?\b", text):
-            tokens.append((match.group().lower(), match.start(), match.end()))
-        return tokens
-
-    def _check_morphology(self, text: str, words: List[Tuple[str, int, int]], has_past_context: bool) -> List[Dict]:
-        """Catches 'buyed', 'goed' and incorrect base forms in past context."""
-        errors = []
-        for word, start, end in words:
-            # 1. Explicit Dictionary Fixes
-            if word in self.MORPHOLOGY_FIXES:
-                correct = self.MORPHOLOGY_FIXES[word]
-                errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': correct, 'explanation': f'Correct spelling/form is "{correct}".', 'sentenceIndex': 0})
-            
-            # 2. Contextual Fix: "wake" in past context
-            elif has_past_context and word == 'wake' and word not in {'to', 'will', 'did'}: # Simplified logic
-                 errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': 'woke', 'explanation': 'Use past tense "woke".', 'sentenceIndex': 0})
-                 
-        return errors
-
-    def _check_missing_apostrophes(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        """Fix contractions missing apostrophes: dont -> don't, its -> it's, etc."""
-        errors = []
-        verbs_after_its = {'is', 'are', 'was', 'were', 'has', 'have', 'had', 'will', 'would', 'could', 'should', 'might', 'been', 'being', 'raining', 'going', 'coming', 'getting', 'looking', 'working', 'making', 'taking', 'doing', 'saying'}
+    def check_text(self, text: str) -> List[Dict]:
+        # Every rule needs at least one letter; skip empty/whitespace/numeric input
+        if not _LETTER_RE.search(text):
+            return []
+        # Fresh dicts on every call: callers mutate the returned errors
+        return [e.to_dict() for e in self._check_text_cached(text)]
+    
+    def check_many(self, texts: List[str]) -> List[List[Dict]]:
+        """Batch form of check_text: one error list per input text, in input order."""
+        # Lookups bound once for the whole batch instead of once per text
+        has_letter = _LETTER_RE.search
+        cached = self._check_text_cached
+        to_dict = RuleError.to_dict
+        return [list(map(to_dict, cached(text))) if has_letter(text) else [] for text in texts]
+    
+    def clear_cache(self) -> None:
+        """Drop memoized results, e.g. after the rule tables have been changed."""
+        self._check_text_cached.cache_clear()
+    
+    def _check_text_uncached(self, text: str) -> Tuple[RuleError, ...]:
+        # 1. Tokenize
+        # Lowercased once here and scanned once for every known phrase
+        text_lower = text.lower()
+        wtokens, wstarts, wends, woriginals = self._tokenize(text, text_lower)
         
-        for i, (word, start, end) in enumerate(words):
-            word_lower = word.lower()
-            
-            # Special case for "its" - only fix if followed by a verb (it's = it is)
-            if word_lower == 'its':
-                if i + 1 < len(words):
-                    next_word = words[i + 1][0].lower()
-                    if next_word in verbs_after_its:
-                        original = text[start:end]
-                        suggestion = "it's" if original[0].islower() else "It's"
-                        errors.append({
-                            'type': 'grammar', 
-                            'position': {'start': start, 'end': end}, 
-                            'original': original, 
-                            'suggestion': suggestion, 
-                            'explanation': '"it\'s" is short for "it is" or "it has".', 
-                            'sentenceIndex': 0
-                        })
-            # All other contractions
-            elif word_lower in self.CONTRACTION_FIXES:
-                original = text[start:end]
-                correct = self.CONTRACTION_FIXES[word_lower]
-                # Preserve capitalization
-                if original[0].isupper():
-                    correct = correct[0].upper() + correct[1:]
-                errors.append({
-                    'type': 'grammar', 
-                    'position': {'start': start, 'end': end}, 
-                    'original': original, 
-                    'suggestion': correct, 
-                    'explanation': f'Missing apostrophe. Use "{correct}".', 
-                    'sentenceIndex': 0
-                })
+        # 2. Detect Context
+        # Whole-word match: 'again' or 'lastly' must not count as 'ago' / 'last'
+        has_keyword = not self.PAST_INDICATORS.isdisjoint(wtokens)
+        # Tokens are punctuation-free, so "went." at a sentence end counts too
+        has_past_verb = not self.STRONG_PAST_VERBS.isdisjoint(wtokens)
+        ctx = _TextContext(text, text_lower, wtokens, wstarts, wends, woriginals,
+                           self._scan_roles(wtokens), self._scan_phrases(text_lower), has_keyword or has_past_verb)
+        # Every per-token rule runs in this single pass over the role hits
+        token_errors = self._check_token_rules(ctx)
         
-        return errors
+        # 3. Apply Checks (one result list per rule, in reporting order)
+        results = (
+            self._check_sentence_capitalization(ctx),
+            token_errors[_ROLE_MORPHOLOGY],
+            self._check_incorrect_regularized_past(ctx),
+            token_errors[_ROLE_APOSTROPHE],
+            self._check_quantifiers(ctx),
+            self._check_double_comparatives(ctx),
+            token_errors[_ROLE_EXPLAIN],
+            self._check_redundancy(ctx),
+            token_errors[_ROLE_FAMILY],
+            token_errors[_ROLE_CONTRACTION],
+            token_errors[_ROLE_BE_VERB],
+            token_errors[_ROLE_IT],
+            token_errors[_ROLE_VERB_BASE],
+            self._check_pronoun_capitalization(ctx),
+            token_errors[_ROLE_VERB_FORM],
+            token_errors[_ROLE_ADJECTIVE],
+            self._check_prepositions(ctx),
+            token_errors[_ROLE_GO],
+        )
+        
+        # One error per span: rules earlier in the order above take precedence.
+        # Emitted in text order; the stable sort on start alone keeps rule order
+        # among overlapping errors that start together (callers apply the first)
+        by_span = {}
+        for error in itertools.chain.from_iterable(results):
+            by_span.setdefault((error.start, error.end), error)
+        return tuple(sorted(by_span.values(), key=lambda error: error.start))
+    
+    def _tokenize(self, text: str, text_lower: str) -> Tuple[List[str], List[int], List[int], List[str]]:
+        """Tokens as parallel lists: (lowercased words, starts, ends, original spellings)."""
+        matches = list(_TOKEN_RE.finditer(text))
+        wstarts = [m.start() for m in matches]
+        wends = [m.end() for m in matches]
+        woriginals = [m.group() for m in matches]
+        # Slice the shared lowercase copy instead of lowering each token, unless
+        # lowering changed the length (e.g. 'İ') and the offsets no longer line up
+        if len(text_lower) == len(text):
+            wtokens = [sys.intern(text_lower[s:e]) for s, e in zip(wstarts, wends)]
+        else:
+            wtokens = [sys.intern(o.lower()) for o in woriginals]
+        return wtokens, wstarts, wends, woriginals
 
-    def _check_verb_tense(self, text: str, words: List[Tuple[str, int, int]], force_past: bool = False) -> List[Dict]:
-        errors = []
-        for i, (word, start, end) in enumerate(words):
-            # Check for "Did" + Base Form rule
-            if i > 0:
-                prev_word = words[i - 1][0]
-                # If previous word is "did" or "didn't", current verb MUST be base
-                if prev_word in {'did', 'didnt', "didn't"}:
-                    if word in self.VERB_FORMS:
-                        # Check if it's NOT the base form (e.g., 'understood' -> 'understand')
-                        # Logic: If word != base form OR word is past form
-                        forms = self.VERB_FORMS[word] # (past, pp, 3rd, ing)
-                        base = self.verb_base_lookup.get(word, word)
-                        
-                        # If word is one of the conjugated forms
-                        if word in forms: 
-                            errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': base, 'explanation': 'Use base form after "did".', 'sentenceIndex': 0})
-                    continue # Skip normal tense check if handled here
-
-                # Skip if preceded by "to" or other modals
-                if prev_word in {'to', 'can', 'could', 'will', 'would', 'should', 'may', 'might', 'must', 'do', 'does'}:
-                    continue
-                
-                # Causative/Perception Exception
-                if i > 1:
-                    prev_prev = words[i-2][0]
-                    if prev_prev in {'help', 'helped', 'helps', 'make', 'made', 'makes', 'let', 'lets', 'see', 'saw', 'watch', 'watched', 'hear', 'heard'}:
-                        continue 
-            
-            # Normal Past Tense Enforcement
-            if force_past:
-                # Allow index 0 check if forced
-                if i == 0 or i > 0:
-                    if word in self.VERB_FORMS and word not in {'be', 'is', 'are', 'was', 'were', 'have', 'has', 'had'}:
-                        past_form = self.VERB_FORMS[word][0]
-                        if word != past_form and word == word: # is base form
-                            cap_suggestion = past_form.capitalize() if i == 0 else past_form
-                            errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': cap_suggestion, 'explanation': 'Use past tense.', 'sentenceIndex': 0})
-        return errors
+    def _scan_phrases(self, text_lower: str) -> Dict[str, List[int]]:
+        """Fixed phrases -> offsets of every (non-overlapping) occurrence; one C-level str.find pass per phrase."""
+        hits = {}
+        for phrase in self._phrases:
+            idx = text_lower.find(phrase)
+            if idx < 0:
+                continue
+            offsets = hits[phrase] = []
+            while idx >= 0:
+                offsets.append(idx)
+                idx = text_lower.find(phrase, idx + len(phrase))
+        return hits
 
-    def _check_subject_verb_agreement(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        errors = []
-        adverbs = {'already', 'just', 'always', 'never', 'really', 'often'}
-        
-        for i, (word, start, end) in enumerate(words):
-            if i > 0:
-                prev_word = words[i - 1][0]
-                actual_subject = prev_word
-                if prev_word in adverbs and i > 1:
-                    actual_subject = words[i - 2][0]
-                
-                # Smart Plural Detection: Ends in 's' and not in singular exceptions list
-                is_plural_noun = (actual_subject.endswith('s') and 
-                                  actual_subject not in self.SINGULAR_SUBJECTS and 
-                                  len(actual_subject) > 3)
-                
-                if actual_subject in self.PLURAL_SUBJECTS or is_plural_noun:
-                    if word == 'is':
-                        errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': 'are', 'explanation': f'"{actual_subject}" is plural.', 'sentenceIndex': 0})
-                    elif word == 'was':
-                         errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': 'were', 'explanation': f'"{actual_subject}" is plural.', 'sentenceIndex': 0})
-                
-                elif actual_subject in self.SINGULAR_SUBJECTS:
-                    if word == 'are':
-                        errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': 'is', 'explanation': f'"{actual_subject}" is singular.', 'sentenceIndex': 0})
-                    elif word == 'were':
-                        errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': 'was', 'explanation': f'"{actual_subject}" is singular.', 'sentenceIndex': 0})
-        return errors
+    def _scan_roles(self, wtokens: List[str]) -> List[Tuple[int, int, _TokenInfo]]:
+        """Single pass over the tokens: (index, role mask, payload) for every token that can trigger a rule."""
+        return [(i, *entry) for i, entry in enumerate(map(self._token_roles.get, wtokens)) if entry]
 
-    def _check_possessives_context(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        errors = []
-        family_triggers = {'mother', 'father', 'brother', 'sister', 'aunt', 'uncle', 'friend', 'neighbor', 'teacher', 'student'}
-        for i, (word, start, end) in enumerate(words):
-            if word in family_triggers:
-                if i + 1 < len(words):
-                    next_word = words[i+1][0]
-                    # If followed by a noun (heuristic: not a verb/preposition)
-                    # Simple check: longer than 3 letters, not in verbs
-                    if len(next_word) > 2 and next_word not in {'was', 'is', 'said', 'went', 'told', 'asked', 'with', 'from', 'to'}:
-                        if not word.endswith('s'):
-                            errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': word + "'s", 'explanation': 'Missing apostrophe for possession.', 'sentenceIndex': 0})
-        return errors
+    def _check_incorrect_regularized_past(self, ctx: _TextContext) -> List[RuleError]:
+        """Catches '-ed' pasts of irregular verbs ('knowed', 'leaded') by stripping the suffix."""
+        # Cheap prefilter: no 'ed' anywhere means no candidate token
+        if 'ed' not in ctx.text_lower:
+            return []
+        found = []
+        for i, word in enumerate(ctx.wtokens):
+            if len(word) < 4 or not word.endswith('ed') or word in self.MORPHOLOGY_FIXES or word in _REAL_ED_WORDS:
+                continue
+            # Candidate stems: like+d, know+ed, stop+p+ed. A short consonant-vowel-consonant
+            # stem would double before '-ed' ('win' -> 'winned'), so 'wined' is only wine+d
+            bare = word[:-2]
+            stems = [word[:-1]]
+            if not (len(bare) >= 3 and bare[-1] not in 'aeiouwxy' and bare[-2] in 'aeiou' and bare[-3] not in 'aeiou'):
+                stems.append(bare)
+            if len(word) > 4 and word[-3] == word[-4] and word[-4] in 'bdgmnprt' and word[-5] in 'aeiou':
+                stems.append(word[:-3])
+            
+            past = None
+            for stem in stems:
+                if stem not in self.verb_bases:
+                    continue
+                stem_past = self.past_forms[stem]
+                if word == stem_past or word == self.past_participles[stem]:
+                    # A genuine regular past ('needed', 'stopped')
+                    past = None
+                    break
+                past = stem_past
+            
+            if past:
+                found.append((i, past))
+        wstarts, wends, woriginals = ctx.wstarts, ctx.wends, ctx.woriginals
+        return [RuleError('grammar', wstarts[i], wends[i], woriginals[i], past, f'Irregular verb: use "{past}".') for i, past in found]
 
-    def _check_sentence_capitalization(self, text: str) -> List[Dict]:
+    def _check_sentence_capitalization(self, ctx: _TextContext) -> List[RuleError]:
+        text = ctx.text
         errors = []
-        first_match = re.match(r'^\s*([a-z])', text)
+        first_match = _FIRST_LOWER_RE.match(text)
         if first_match:
-            errors.append({'type': 'grammar', 'position': {'start': first_match.start(1), 'end': first_match.end(1)}, 'original': first_match.group(1), 'suggestion': first_match.group(1).upper(), 'explanation': 'Sentences should start with a capital letter.', 'sentenceIndex': 0})
-        for match in re.finditer(r'([.!?]\s+)([a-z])', text):
-            errors.append({'type': 'grammar', 'position': {'start': match.start(2), 'end': match.end(2)}, 'original': match.group(2), 'suggestion': match.group(2).upper(), 'explanation': 'Sentences should start with a capital letter.', 'sentenceIndex': 0})
+            errors.append(RuleError('grammar', first_match.start(1), first_match.end(1), first_match.group(1), first_match.group(1).upper(), 'Sentences should start with a capital letter.'))
+        for match in _SENTENCE_START_RE.finditer(text):
+            errors.append(RuleError('grammar', match.start(2), match.end(2), match.group(2), match.group(2).upper(), 'Sentences should start with a capital letter.'))
         return errors
 
-    def _check_quantifiers(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
+    def _check_quantifiers(self, ctx: _TextContext) -> List[RuleError]:
+        # Both patterns need the literal word, so skip the regex scans without it
+        if 'enough' not in ctx.text_lower:
+            return []
+        text = ctx.text
         errors = []
-        for match in re.finditer(r'^\s*(no)\s+enough\b', text, re.IGNORECASE | re.MULTILINE):
-            errors.append({'type': 'grammar', 'position': {'start': match.start(1), 'end': match.end(1)}, 'original': match.group(1), 'suggestion': 'Not', 'explanation': 'Use "Not enough".', 'sentenceIndex': 0})
-        for match in re.finditer(r'(?<!^)\s+(no)\s+enough\b', text, re.IGNORECASE):
-            errors.append({'type': 'grammar', 'position': {'start': match.start(1), 'end': match.end(1)}, 'original': match.group(1), 'suggestion': 'not', 'explanation': 'Use "not enough".', 'sentenceIndex': 0})
+        for match in _LEADING_NO_ENOUGH_RE.finditer(text):
+            errors.append(RuleError('grammar', match.start(1), match.end(1), match.group(1), 'Not', 'Use "Not enough".'))
+        for match in _INNER_NO_ENOUGH_RE.finditer(text):
+            errors.append(RuleError('grammar', match.start(1), match.end(1), match.group(1), 'not', 'Use "not enough".'))
         return errors
 
-    def _check_double_comparatives(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
+    def _check_double_comparatives(self, ctx: _TextContext) -> List[RuleError]:
+        if 'more' not in ctx.text_lower:
+            return []
         errors = []
-        for match in re.finditer(r'\bmore\s+([a-z]+er)\b', text, re.IGNORECASE):
+        for match in _DOUBLE_COMPARATIVE_RE.finditer(ctx.text):
             adj = match.group(1)
-            if adj not in {'never', 'ever', 'over', 'under', 'river', 'paper', 'water', 'corner', 'father', 'mother', 'brother', 'sister', 'summer', 'winter', 'dinner'}:
-                errors.append({'type': 'grammar', 'position': {'start': match.start(), 'end': match.end()}, 'original': match.group(), 'suggestion': adj, 'explanation': f'Redundant comparative.', 'sentenceIndex': 0})
+            errors.append(RuleError('grammar', match.start(), match.end(), match.group(), adj, f'Redundant comparative.'))
         return errors
 
-    def _check_explain_errors(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        errors = []
-        for i, (word, start, end) in enumerate(words):
-            if word in ('explain', 'explained') and i + 1 < len(words):
-                if words[i+1][0] in {'him', 'her', 'me', 'us', 'them', 'you'}:
-                    errors.append({'type': 'grammar', 'position': {'start': start, 'end': words[i+1][2]}, 'original': text[start:words[i+1][2]], 'suggestion': f'{word} to {words[i+1][0]}', 'explanation': f'Use "to" after "{word}".', 'sentenceIndex': 0})
-        return errors
-
-    def _check_prepositions(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        errors = []
-        prep_map = {'married with': 'married to', 'good in': 'good at', 'angry to': 'angry with', 'depend of': 'depend on', 'listen her': 'listen to her', 'arrive to': 'arrive at'}
-        tl = text.lower()
-        for w, r in prep_map.items():
-            if w in tl:
-                idx = tl.find(w)
-                errors.append({'type': 'grammar', 'position': {'start': idx, 'end': idx+len(w)}, 'original': text[idx:idx+len(w)], 'suggestion': r, 'explanation': f'Use "{r}".', 'sentenceIndex': 0})
+    def _check_token_rules(self, ctx: _TextContext) -> Dict[int, List[RuleError]]:
+        """
+        One pass over the role hits for every single-token rule.
+        Returns role bit -> errors of the rule behind that role, so each
+        rule's errors keep their place in the reporting order.
+        """
+        text, wtokens, wstarts, wends, woriginals = ctx.text, ctx.wtokens, ctx.wstarts, ctx.wends, ctx.woriginals
+        force_past = ctx.past_context
+        morphology_errors, apostrophe_errors, contraction_errors, agreement_errors = [], [], [], []
+        possessive_errors, tense_errors, to_form_errors, family_errors = [], [], [], []
+        explain_errors, go_errors, adverb_errors = [], [], []
+        last = len(wtokens) - 1
+        for i, roles, info in ctx.hits:
+            word = wtokens[i]
+            prev_word = wtokens[i - 1] if i else None
+            next_word = wtokens[i + 1] if i < last else None
+            
+            # Morphology: every word with this role has an explicit dictionary fix ('buyed', 'goed')
+            if roles & _ROLE_MORPHOLOGY:
+                correct = info.fix
+                morphology_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], correct, f'Correct spelling/form is "{correct}".'))
+            
+            # Missing apostrophes: dont -> don't, its -> it's, etc.
+            if roles & _ROLE_APOSTROPHE:
+                original = woriginals[i]
+                # Special case for "its" - only fix if followed by a verb (it's = it is)
+                if word == 'its':
+                    if next_word in _VERBS_AFTER_ITS:
+                        suggestion = "it's" if original[0].islower() else "It's"
+                        apostrophe_errors.append(RuleError('grammar', wstarts[i], wends[i], original, suggestion, '"it\'s" is short for "it is" or "it has".'))
+                # All other contractions
+                elif info.apostrophe:
+                    correct = info.apostrophe
+                    # Preserve capitalization
+                    if original[0].isupper():
+                        correct = correct[0].upper() + correct[1:]
+                    apostrophe_errors.append(RuleError('grammar', wstarts[i], wends[i], original, correct, f'Missing apostrophe. Use "{correct}".'))
+            
+            if roles & _ROLE_CONTRACTION:
+                contraction_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], info.contraction, 'Fix contraction.'))
+            
+            # Subject-verb agreement on is/are/was/were
+            if roles & _ROLE_BE_VERB and i:
+                # Each be-verb has exactly one replacement per subject number
+                plural_fix = self.BE_PLURAL_FIX.get(word)
+                actual_subject = prev_word
+                if prev_word in _SVA_ADVERBS and i > 1:
+                    actual_subject = wtokens[i - 2]
+                
+                # One probe classifies the subject as known singular, known plural or unknown
+                kind = self._subject_kind.get(actual_subject)
+                # Smart Plural Detection: unknown words ending in 's' count as plural
+                if kind == _SUBJECT_PLURAL or (kind is None and actual_subject.endswith('s') and len(actual_subject) > 3):
+                    if plural_fix:
+                        agreement_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], plural_fix, f'"{actual_subject}" is plural.'))
+                
+                elif not plural_fix and kind == _SUBJECT_SINGULAR:
+                    agreement_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], self.BE_SINGULAR_FIX[word], f'"{actual_subject}" is singular.'))
+            
+            if roles & _ROLE_IT and next_word in _POSS_NOUNS:
+                possessive_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], 'its', 'Use "its".'))
+            
+            if roles & _ROLE_VERB_BASE:
+                # If previous word is "did" or "didn't", current verb MUST be base
+                if prev_word in _DID_FORMS:
+                    # If word is one of the conjugated forms
+                    if word in self.self_inflected_verbs:
+                        tense_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], info.base, 'Use base form after "did".'))
+                # Normal Past Tense Enforcement, unless preceded by "to"/a modal
+                # or by a causative/perception verb ("help", "let", "saw")
+                elif (force_past
+                        and info.past
+                        and prev_word not in _MODALS
+                        and (i < 2 or wtokens[i - 2] not in _CAUSATIVES)):
+                    cap_suggestion = info.past.capitalize() if i == 0 else info.past
+                    tense_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], cap_suggestion, 'Use past tense.'))
+            
+            # The role is only set on inflected forms, so no base comparison is needed
+            if roles & _ROLE_VERB_FORM and prev_word == 'to':
+                base = info.base
+                to_form_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], base, f'Use base form "{base}" after "to".'))
+            
+            # Family noun followed by a noun (heuristic: not a verb/preposition)
+            if (roles & _ROLE_FAMILY and next_word is not None and len(next_word) > 2
+                    and next_word not in _NOT_POSSESSED
+                    and not word.endswith('s')):
+                family_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], word + "'s", 'Missing apostrophe for possession.'))
+            
+            if roles & _ROLE_EXPLAIN and next_word in _EXPLAIN_OBJECTS:
+                start, end = wstarts[i], wends[i + 1]
+                explain_errors.append(RuleError('grammar', start, end, text[start:end], f'{word} to {next_word}', f'Use "to" after "{word}".'))
+            
+            # go/went + destination without "to"
+            if roles & _ROLE_GO and next_word is not None and next_word not in _GO_EXCEPTIONS:
+                if next_word in _ZERO_ARTICLE:
+                    go_errors.append(RuleError('grammar', wstarts[i + 1], wends[i + 1], next_word, 'to ' + next_word, 'Missing "to".'))
+                elif next_word in _DEFINITE or (next_word.endswith('s') and len(next_word)>3):
+                    go_errors.append(RuleError('grammar', wstarts[i + 1], wends[i + 1], next_word, 'to the ' + next_word, 'Missing "to the".'))
+            
+            if roles & _ROLE_ADJECTIVE and prev_word in _MANNER_VERBS:
+                adverb_errors.append(RuleError('grammar', wstarts[i], wends[i], woriginals[i], info.adverb, 'Use adverb.'))
         
-        go_exceptions = {'to', 'into', 'in', 'out', 'up', 'down', 'back', 'on', 'home', 'away'}
-        for i, (word, start, end) in enumerate(words):
-            if word in ('go', 'goes', 'went', 'going') and i + 1 < len(words):
-                nw = words[i+1][0]
-                if nw not in go_exceptions:
-                    if nw in {'work', 'school', 'bed', 'church', 'college', 'jail'}:
-                        errors.append({'type': 'grammar', 'position': {'start': words[i+1][1], 'end': words[i+1][2]}, 'original': nw, 'suggestion': 'to ' + nw, 'explanation': 'Missing "to".', 'sentenceIndex': 0})
-                    elif nw in {'library', 'mall', 'park', 'cinema', 'gym', 'bank'} or (nw.endswith('s') and len(nw)>3):
-                        errors.append({'type': 'grammar', 'position': {'start': words[i+1][1], 'end': words[i+1][2]}, 'original': nw, 'suggestion': 'to the ' + nw, 'explanation': 'Missing "to the".', 'sentenceIndex': 0})
-        return errors
-
-    def _check_to_verb_form(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        errors = []
-        for i, (word, start, end) in enumerate(words):
-            if i > 0 and words[i-1][0] == 'to' and word in self.verb_base_lookup:
-                base = self.verb_base_lookup[word]
-                if word != base:
-                    errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': base, 'explanation': f'Use base form "{base}" after "to".', 'sentenceIndex': 0})
-        return errors
-
-    def _check_adverbs(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        errors = []
-        adj_to_adv = {'quick': 'quickly', 'slow': 'slowly', 'loud': 'loudly', 'quiet': 'quietly', 'bad': 'badly'}
-        verbs = {'run', 'runs', 'ran', 'walk', 'walks', 'walked', 'speak', 'spoke', 'speaks', 'sing', 'sang', 'arrive', 'arrived'}
-        for i, (word, start, end) in enumerate(words):
-            if i > 0 and words[i-1][0] in verbs and word in adj_to_adv:
-                 errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': adj_to_adv[word], 'explanation': 'Use adverb.', 'sentenceIndex': 0})
-        return errors
+        return {
+            _ROLE_MORPHOLOGY: morphology_errors,
+            _ROLE_APOSTROPHE: apostrophe_errors,
+            _ROLE_CONTRACTION: contraction_errors,
+            _ROLE_BE_VERB: agreement_errors,
+            _ROLE_IT: possessive_errors,
+            _ROLE_VERB_BASE: tense_errors,
+            _ROLE_VERB_FORM: to_form_errors,
+            _ROLE_FAMILY: family_errors,
+            _ROLE_EXPLAIN: explain_errors,
+            _ROLE_GO: go_errors,
+            _ROLE_ADJECTIVE: adverb_errors,
+        }
 
-    def _check_redundancy(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        errors = []
-        red = {'return back': 'return', 'repeat again': 'repeat', 'reply back': 'reply', 'join together': 'join'}
-        for p, f in red.items():
-            if p in text.lower():
-                idx = text.lower().find(p)
-                errors.append({'type': 'grammar', 'position': {'start': idx, 'end': idx+len(p)}, 'original': text[idx:idx+len(p)], 'suggestion': f, 'explanation': 'Redundant.', 'sentenceIndex': 0})
-        return errors
+    def _check_pronoun_capitalization(self, ctx: _TextContext) -> List[RuleError]:
+        return [RuleError('grammar', m.start(), m.end(), 'i', 'I', 'Capitalize "I".') for m in _LOWER_I_RE.finditer(ctx.text)]
 
-    def _check_pronoun_capitalization(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
+    def _check_prepositions(self, ctx: _TextContext) -> List[RuleError]:
+        text, phrase_hits = ctx.text, ctx.phrase_hits
         errors = []
-        for word, start, end in words:
-            if word == 'i':
-                errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': 'I', 'explanation': 'Capitalize "I".', 'sentenceIndex': 0})
+        for w, r in self.PREPOSITION_FIXES.items():
+            for idx in phrase_hits.get(w, ()):
+                errors.append(RuleError('grammar', idx, idx+len(w), text[idx:idx+len(w)], r, f'Use "{r}".'))
         return errors
 
-    def _check_contractions(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
+    def _check_redundancy(self, ctx: _TextContext) -> List[RuleError]:
+        text, phrase_hits = ctx.text, ctx.phrase_hits
         errors = []
-        contraction_fixes = {'dont': "don't", 'didnt': "didn't", 'cant': "can't", 'im': "I'm", 'its': "it's"}
-        for word, start, end in words:
-            if word in contraction_fixes:
-                errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': contraction_fixes[word], 'explanation': 'Fix contraction.', 'sentenceIndex': 0})
+        for p, f in self.REDUNDANT_PHRASES.items():
+            for idx in phrase_hits.get(p, ()):
+                errors.append(RuleError('grammar', idx, idx+len(p), text[idx:idx+len(p)], f, 'Redundant.'))
         return errors
 
-    def _check_possessive_pronouns(self, text: str, words: List[Tuple[str, int, int]]) -> List[Dict]:
-        errors = []
-        for i, (word, start, end) in enumerate(words):
-            if word == 'it' and i < len(words)-1 and words[i+1][0] in {'battery', 'phone', 'car'}:
-                errors.append({'type': 'grammar', 'position': {'start': start, 'end': end}, 'original': text[start:end], 'suggestion': 'its', 'explanation': 'Use "its".', 'sentenceIndex': 0})
-        return errors
+    # Placeholders for rules not implemented yet; not called from check_text
+    def _check_say_to_tell(self, ctx): return []
+    def _check_past_tense_after_conjunction(self, ctx): return []
+    def _check_gerund_patterns(self, ctx): return []
+    def _check_plural_nouns(self, ctx): return []
+    def _check_infinitive_patterns(self, ctx): return []
+    def _check_articles(self, ctx): return []
+    def _check_confused_words(self, ctx): return []
+    def _check_prepositions_context(self, ctx): return []
+    def _check_progressive_tense(self, ctx): return []
+    def _check_third_person_verbs(self, ctx): return []
 
-    # Placeholders for others to prevent errors if called
-    def _check_say_to_tell(self, t, w): return []
-    def _check_past_tense_after_conjunction(self, t, w): return []
-    def _check_gerund_patterns(self, t, w): return []
-    def _check_plural_nouns(self, t, w): return []
-    def _check_incorrect_regularized_past(self, t, w): return []
-    def _check_infinitive_patterns(self, t, w): return []
-    def _check_articles(self, t, w): return []
-    def _check_confused_words(self, t, w): return []
-    def _check_prepositions_context(self, t, w): return []
-    def _check_progressive_tense(self, t, w): return []
-    def _check_third_person_verbs(self, t, w): return []
-
-_grammar_rules_checker = None
+@functools.cache
 def get_grammar_rules_checker() -> GrammarRulesChecker:
-    global _grammar_rules_checker
-    if _grammar_rules_checker is None:
-        _grammar_rules_checker = GrammarRulesChecker()
-    return _grammar_rules_checker
+    # Zero-arg cached function: built lazily on first use, then a plain cache hit
+    return GrammarRulesChecker()
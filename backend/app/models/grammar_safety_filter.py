@@ -17,7 +17,9 @@ Transformer Output → Spell-Safety → GRAMMAR-SAFETY → Final Output
 """
 
 from typing import List, Tuple, Optional, Dict
+import math
 import re
+import threading
 
 
 class GrammarSafetyFilter:
@@ -91,6 +93,22 @@ class GrammarSafetyFilter:
     
     # Minimum probability improvement ratio to trigger replacement
     MIN_IMPROVEMENT_RATIO = 1.5
+    # Scores are log-probabilities, so the ratio becomes an additive margin
+    _LOG_MIN_IMPROVEMENT = math.log(MIN_IMPROVEMENT_RATIO)
+    
+    # Floor for zero probabilities before taking the log
+    _MIN_PROB = 1e-12
+    
+    # Word tokens (contractions kept whole), compiled once
+    _TOKEN_RE = re.compile(r"\b[\w']+\b")
+    
+    # Any grammar-sensitive word, scanned for in one C-level pass before tokenizing
+    _TRIGGER_RE = re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, GRAMMAR_PATTERNS)), re.IGNORECASE)
+    
+    # Frozen view of GRAMMAR_PATTERNS: word -> the variants other than the word itself
+    _ALTERNATIVES: Dict[str, Tuple[str, ...]] = {
+        word: tuple(v for v in variants if v != word) for word, variants in GRAMMAR_PATTERNS.items()
+    }
     
     def __init__(self, ngram_model):
         """
@@ -117,59 +135,66 @@ class GrammarSafetyFilter:
         if not text or not text.strip():
             return text
         
+        # Nothing to compare: skip tokenizing and scoring entirely
+        if not self._TRIGGER_RE.search(text):
+            return text
+        
         # Tokenize
         tokens = self._tokenize(text)
-        words = [t[0].lower() for t in tokens]
         
-        corrected_text = text
-        offset = 0
+        # Output pieces: untouched gaps between corrections plus the corrected words
+        pieces = []
+        prev_end = 0
         
         for i, (word, start, end) in enumerate(tokens):
             word_lower = word.lower()
             
-            # Check if word is grammar-sensitive
-            if word_lower not in self.GRAMMAR_PATTERNS:
+            # Check if word is grammar-sensitive (one probe also yields its variants)
+            alternatives = self._ALTERNATIVES.get(word_lower)
+            if alternatives is None:
                 continue
             
-            # Get context window
-            context_before = words[max(0, i - self.CONTEXT_WINDOW):i]
-            context_after = words[i + 1:i + 1 + self.CONTEXT_WINDOW]
-            
-            # Get variants to compare
-            variants = self.GRAMMAR_PATTERNS[word_lower]
+            # Get context window (lowercased only around grammar-sensitive words)
+            context_before = [t[0].lower() for t in tokens[max(0, i - self.CONTEXT_WINDOW):i]]
+            context_after = [t[0].lower() for t in tokens[i + 1:i + 1 + self.CONTEXT_WINDOW]]
             
             # Score each variant
             best_variant = word_lower
             best_score = self._score_variant(word_lower, context_before, context_after)
             
-            for variant in variants:
-                if variant == word_lower:
-                    continue
-                    
+            for variant in alternatives:
                 score = self._score_variant(variant, context_before, context_after)
                 
                 # Replace only if significantly better
-                if score > best_score * self.MIN_IMPROVEMENT_RATIO:
+                if score > best_score + self._LOG_MIN_IMPROVEMENT:
                     best_variant = variant
                     best_score = score
             
             # Apply correction if better variant found
             if best_variant != word_lower:
                 # Preserve casing
-                corrected_variant = self._preserve_casing(word, best_variant)
-                
-                adj_start = start + offset
-                adj_end = end + offset
-                corrected_text = corrected_text[:adj_start] + corrected_variant + corrected_text[adj_end:]
-                
-                offset += len(corrected_variant) - len(word)
+                pieces.append(text[prev_end:start])
+                pieces.append(self._preserve_casing(word, best_variant))
+                prev_end = end
+        
+        if not pieces:
+            return text
+        pieces.append(text[prev_end:])
+        return "".join(pieces)
+    
+    def cache_info(self):
+        """
+        Statistics of the shared probability cache behind variant scoring.
         
-        return corrected_text
+        Scores are built from the model's memoized probabilities, which live
+        as long as the model, so repeated triggers across calls are cache hits.
+        """
+        return self.model.cache_info()
     
     def _tokenize(self, text: str) -> List[Tuple[str, int, int]]:
         """Tokenize text with positions."""
         tokens = []
-        for match in re.finditer(r"\b[\w']+\b", text):
+        for match in self._TOKEN_RE.finditer(text):
             tokens.append((match.group(), match.start(), match.end()))
         return tokens
     
@@ -177,7 +202,8 @@ class GrammarSafetyFilter:
         """
         Score a word variant using n-gram probability.
         
-        Uses both forward and backward context for bidirectional scoring.
+        Uses both forward and backward context for bidirectional scoring;
+        the score is the joint log-probability of both directions.
         """
         if not self.model._trained:
             return 0.0
@@ -191,7 +217,7 @@ class GrammarSafetyFilter:
                 context_before[-2:],  # Last 2 words
                 order=3
             )
-            score += forward_prob
+            score += math.log(max(forward_prob, self._MIN_PROB))
         
         # Backward probability: P(next_word | word + context)
         if context_after:
@@ -201,12 +227,15 @@ class GrammarSafetyFilter:
                 context_with_word,
                 order=3
             )
-            score += backward_prob
+            score += math.log(max(backward_prob, self._MIN_PROB))
         
         return score
     
     def _preserve_casing(self, original: str, correction: str) -> str:
         """Preserve the casing pattern of original word."""
+        # Common case: lowercase word, and every variant is stored lowercase already
+        if original.islower():
+            return correction
         if original.isupper():
             return correction.upper()
         elif original[0].isupper():
@@ -220,6 +249,7 @@ class GrammarSafetyFilter:
 # ============================================================
 
 _grammar_safety_filter: Optional[GrammarSafetyFilter] = None
+_grammar_safety_filter_lock = threading.Lock()
 
 
 def get_grammar_safety_filter() -> GrammarSafetyFilter:
@@ -228,12 +258,16 @@ def get_grammar_safety_filter() -> GrammarSafetyFilter:
     """
     global _grammar_safety_filter
     
+    # Double-checked: the lock is only taken until the filter exists, and
+    # concurrent first requests still build it exactly once
     if _grammar_safety_filter is None:
-        from app.models.ngram_model import get_model
-        
-        model = get_model()
-        _grammar_safety_filter = GrammarSafetyFilter(model)
-        print("[GRAMMAR-SAFETY] Initialized with n-gram probability scoring")
+        with _grammar_safety_filter_lock:
+            if _grammar_safety_filter is None:
+                from app.models.ngram_model import get_model
+                
+                model = get_model()
+                _grammar_safety_filter = GrammarSafetyFilter(model)
+                print("[GRAMMAR-SAFETY] Initialized with n-gram probability scoring")
     
     return _grammar_safety_filter
 
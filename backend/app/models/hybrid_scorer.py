@@ -3,9 +3,11 @@ Hybrid Scorer for N-gram System.
 Combines scores from Word N-gram, Character N-gram, and 4-gram models.
 """
 
-from typing import Dict, List, Optional
+import math
+from typing import Dict, List, Optional, Tuple
 from app.models.ngram_model import NgramModel
 from app.models.char_ngram_model import CharNgramModel
+from app.utils.edit_distance import levenshtein_distance
 
 class HybridScorer:
     """
@@ -37,6 +39,10 @@ class HybridScorer:
         Calculate final weighted score for a candidate word.
         Returns a normalized score (higher is better).
         """
+        return self._score(candidate, context, original_word.lower() if original_word else None)
+
+    def _score(self, candidate: str, context: List[str], original_lower: Optional[str]) -> float:
+        """score_candidate with the original word already lowercased (shared across a ranking)."""
         score = 0.0
         
         # 1. Word N-gram Score (Fluency/Grammar)
@@ -50,12 +56,8 @@ class HybridScorer:
             # or treat as feature. Here we use exponential to make it comparable
             char_log_prob = self.char_model.score_word(candidate)
             # Normalize: typical log probs are negative. 
-            # Exp(log_prob) gives probability [0, 1]
-            char_prob = 0.0
-            try:
-                char_prob = pow(2.718, char_log_prob) 
-            except:
-                char_prob = 0.0
+            # Exp(log_prob) gives probability [0, 1]; very negative scores underflow to 0.0
+            char_prob = math.exp(char_log_prob)
                 
             score += self.weights['char'] * char_prob
             
@@ -67,9 +69,8 @@ class HybridScorer:
              
         # Bonus: Edit Distance penalty if original_word provided
         # This keeps corrections close to original
-        if original_word:
-            from app.utils.edit_distance import levenshtein_distance
-            dist = levenshtein_distance(original_word.lower(), candidate.lower())
+        if original_lower:
+            dist = levenshtein_distance(original_lower, candidate.lower())
             if dist > 0:
                 # Penalty factor
                 score = score * (1.0 / (dist + 1))
@@ -83,11 +84,19 @@ class HybridScorer:
         """
         Rank a list of candidates and return them sorted by score.
         """
-        scored = []
-        for cand in candidates:
-            score = self.score_candidate(cand, context, original_word)
-            scored.append((cand, score))
+        return [s[0] for s in self.score_candidates(candidates, context, original_word)]
+
+    def score_candidates(self, 
+                        candidates: List[str], 
+                        context: List[str],
+                        original_word: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        Like rank_candidates, but keeps each candidate's score: (candidate, score) pairs, best first.
+        """
+        # Per-call work (lowercasing the original) is done once for the whole list
+        original_lower = original_word.lower() if original_word else None
+        scored = [(cand, self._score(cand, context, original_lower)) for cand in candidates]
             
         # Sort desc
         scored.sort(key=lambda x: x[1], reverse=True)
-        return [s[0] for s in scored]
+        return scored
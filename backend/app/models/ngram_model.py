@@ -4,6 +4,9 @@ Supports Bigram, Trigram, and 4-gram (Quadgram) models.
 """
 
 import math
+import functools
+import heapq
+import threading
 from collections import Counter, defaultdict
 from typing import Dict, List, Set, Tuple, Optional
 import pickle
@@ -20,6 +23,9 @@ class NgramModel:
     
     DISCOUNT = 0.75
     
+    # Memoized interpolated_probability results per model (scorers re-query the same contexts)
+    CACHE_SIZE = 2 ** 16
+    
     def __init__(self):
         self.unigram_counts: Counter = Counter()
         self.bigram_counts: Dict[str, Counter] = defaultdict(Counter)
@@ -35,38 +41,93 @@ class NgramModel:
         self.fourgram_continuation: Counter = Counter()
         
         self._trained = False
+        
+        # Per-context total counts (the smoothing denominators), rebuilt whenever the counts change
+        self._bigram_totals: Dict[str, int] = {}
+        self._trigram_totals: Dict[Tuple[str, str], int] = {}
+        self._fourgram_totals: Dict[Tuple[str, str, str], int] = {}
+        
+        # Vocabulary deletion index for spelling candidates, built on first use
+        self._deletion_index: Optional[Dict[str, List[str]]] = None
+        
+        self._interpolated_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._interpolated_uncached)
+    
+    def __getstate__(self) -> Dict:
+        # The memo wraps a bound method and is not picklable; rebuilt on unpickling.
+        # The deletion index is derived from the vocabulary and rebuilt at the next train/merge/load.
+        state = self.__dict__.copy()
+        del state['_interpolated_cached']
+        state['_deletion_index'] = None
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._interpolated_cached = functools.lru_cache(maxsize=self.CACHE_SIZE)(self._interpolated_uncached)
+    
+    def clear_cache(self) -> None:
+        """Drop memoized probabilities."""
+        self._interpolated_cached.cache_clear()
+    
+    def cache_info(self):
+        """Hit/miss statistics of the probability memo (functools.lru_cache info)."""
+        return self._interpolated_cached.cache_info()
+    
+    def _index_counts(self) -> None:
+        """Recompute the per-context totals and candidate index; drop stale cached probabilities."""
+        self._bigram_totals = {c: sum(v.values()) for c, v in self.bigram_counts.items()}
+        self._trigram_totals = {c: sum(v.values()) for c, v in self.trigram_counts.items()}
+        self._fourgram_totals = {c: sum(v.values()) for c, v in self.fourgram_counts.items()}
+        self._build_candidate_index()
+        self.clear_cache()
     
     def train(self, corpus: List[List[str]]) -> None:
         """Train the model on a corpus."""
+        bigram_counts, trigram_counts, fourgram_counts = self.bigram_counts, self.trigram_counts, self.fourgram_counts
         for sentence in corpus:
             if len(sentence) < 1: continue
             
             words = [w.lower() for w in sentence if w.isalpha() or "'" in w]
             
-            for i, word in enumerate(words):
-                self.unigram_counts[word] += 1
-                self.vocabulary.add(word)
-                self.total_words += 1
-                
-                # Bigrams
-                if i >= 1:
-                    prev = words[i - 1]
-                    self.bigram_counts[prev][word] += 1
-                    self.bigram_continuation[word] += 1
-                
-                # Trigrams
-                if i >= 2:
-                    context = (words[i-2], words[i-1])
-                    self.trigram_counts[context][word] += 1
-                    self.trigram_continuation[word] += 1
-                
-                # 4-grams
-                if i >= 3:
-                    context = (words[i-3], words[i-2], words[i-1])
-                    self.fourgram_counts[context][word] += 1
-                    self.fourgram_continuation[word] += 1
+            # Whole-sentence Counter/set updates run their loops in C
+            self.unigram_counts.update(words)
+            self.vocabulary.update(words)
+            self.total_words += len(words)
+            
+            # Continuation counts: every word with at least 1, 2 or 3 words before it
+            self.bigram_continuation.update(words[1:])
+            self.trigram_continuation.update(words[2:])
+            self.fourgram_continuation.update(words[3:])
+            
+            # Bigrams
+            for prev, word in zip(words, words[1:]):
+                bigram_counts[prev][word] += 1
+            
+            # Trigrams
+            for c1, c2, word in zip(words, words[1:], words[2:]):
+                trigram_counts[(c1, c2)][word] += 1
+            
+            # 4-grams
+            for c1, c2, c3, word in zip(words, words[1:], words[2:], words[3:]):
+                fourgram_counts[(c1, c2, c3)][word] += 1
         
         self._trained = True
+        self._index_counts()
+    
+    def merge(self, other: "NgramModel") -> None:
+        """Add the counts of another model (e.g. one trained on a different corpus) into this one."""
+        self.unigram_counts.update(other.unigram_counts)
+        self.vocabulary.update(other.vocabulary)
+        self.total_words += other.total_words
+        for table, other_table in ((self.bigram_counts, other.bigram_counts),
+                                   (self.trigram_counts, other.trigram_counts),
+                                   (self.fourgram_counts, other.fourgram_counts)):
+            for context, counts in other_table.items():
+                table[context].update(counts)
+        self.bigram_continuation.update(other.bigram_continuation)
+        self.trigram_continuation.update(other.trigram_continuation)
+        self.fourgram_continuation.update(other.fourgram_continuation)
+        self._trained = True
+        self._index_counts()
     
     def train_from_text(self, text: str) -> None:
         from app.utils.sentence_splitter import split_sentences
@@ -76,22 +137,37 @@ class NgramModel:
         self.train(corpus)
     
     def unigram_probability(self, word: str) -> float:
-        word = word.lower()
+        return self._unigram(word.lower())
+    
+    def bigram_probability(self, word: str, context: str) -> float:
+        return self._bigram(word.lower(), context.lower())
+    
+    def trigram_probability(self, word: str, c1: str, c2: str) -> float:
+        word, c2 = word.lower(), c2.lower()
+        return self._trigram(word, (c1.lower(), c2), self._bigram(word, c2))
+
+    def fourgram_probability(self, word: str, c1: str, c2: str, c3: str) -> float:
+        word, c2, c3 = word.lower(), c2.lower(), c3.lower()
+        return self._fourgram(word, (c1.lower(), c2, c3), self.trigram_probability(word, c2, c3))
+    
+    # Kneser-Ney estimators on already-lowercased input. Each higher order takes the
+    # lower-order estimate it backs off to, so interpolation computes every level once.
+    
+    def _unigram(self, word: str) -> float:
         if self.total_words == 0: return 1e-10
         count = self.unigram_counts.get(word, 0)
         if count == 0: return 1.0 / (self.total_words + len(self.vocabulary))
         return count / self.total_words
     
-    def bigram_probability(self, word: str, context: str) -> float:
-        word = word.lower()
-        context = context.lower()
-        context_count = sum(self.bigram_counts[context].values())
-        if context_count == 0: return self.unigram_probability(word)
+    def _bigram(self, word: str, context: str) -> float:
+        context_count = self._bigram_totals.get(context, 0)
+        if context_count == 0: return self._unigram(word)
         
-        word_count = self.bigram_counts[context].get(word, 0)
+        counts = self.bigram_counts[context]
+        word_count = counts.get(word, 0)
         discounted = max(word_count - self.DISCOUNT, 0) / context_count
         
-        unique_contexts = len(self.bigram_counts[context])
+        unique_contexts = len(counts)
         lambda_weight = (self.DISCOUNT * unique_contexts) / context_count
         
         # Approximate continuation probability
@@ -100,67 +176,72 @@ class NgramModel:
         
         return discounted + lambda_weight * max(p_continuation, 1e-10)
     
-    def trigram_probability(self, word: str, c1: str, c2: str) -> float:
-        word = word.lower()
-        c1, c2 = c1.lower(), c2.lower()
-        context = (c1, c2)
-        
-        context_count = sum(self.trigram_counts[context].values())
-        if context_count == 0: return self.bigram_probability(word, c2)
+    def _trigram(self, word: str, context: Tuple[str, str], p_bi: float) -> float:
+        """p_bi: bigram estimate of word after context[-1]."""
+        context_count = self._trigram_totals.get(context, 0)
+        if context_count == 0: return p_bi
         
-        word_count = self.trigram_counts[context].get(word, 0)
+        counts = self.trigram_counts[context]
+        word_count = counts.get(word, 0)
         discounted = max(word_count - self.DISCOUNT, 0) / context_count
         
-        unique_contexts = len(self.trigram_counts[context])
+        unique_contexts = len(counts)
         lambda_weight = (self.DISCOUNT * unique_contexts) / context_count
         
-        return discounted + lambda_weight * self.bigram_probability(word, c2)
+        return discounted + lambda_weight * p_bi
 
-    def fourgram_probability(self, word: str, c1: str, c2: str, c3: str) -> float:
-        word = word.lower()
-        c1, c2, c3 = c1.lower(), c2.lower(), c3.lower()
-        context = (c1, c2, c3)
-        
-        context_count = sum(self.fourgram_counts[context].values())
-        if context_count == 0: return self.trigram_probability(word, c2, c3)
+    def _fourgram(self, word: str, context: Tuple[str, str, str], p_tri: float) -> float:
+        """p_tri: trigram estimate of word after context[-2:]."""
+        context_count = self._fourgram_totals.get(context, 0)
+        if context_count == 0: return p_tri
         
-        word_count = self.fourgram_counts[context].get(word, 0)
+        counts = self.fourgram_counts[context]
+        word_count = counts.get(word, 0)
         discounted = max(word_count - self.DISCOUNT, 0) / context_count
         
-        unique_contexts = len(self.fourgram_counts[context])
+        unique_contexts = len(counts)
         lambda_weight = (self.DISCOUNT * unique_contexts) / context_count
         
-        return discounted + lambda_weight * self.trigram_probability(word, c2, c3)
+        return discounted + lambda_weight * p_tri
     
     def interpolated_probability(self, word: str, context: List[str], order: int = 3) -> float:
         """
         Calculate probability based on N-gram order (2, 3, or 4).
         """
-        p_uni = self.unigram_probability(word)
+        # Every estimator lowercases its inputs and at most 3 context words are used,
+        # so the normalized tail is an exact cache key
+        return self._interpolated_cached(word.lower(), tuple(c.lower() for c in context[-3:]), order)
+    
+    def _interpolated_uncached(self, word: str, context: Tuple[str, ...], order: int) -> float:
+        p_uni = self._unigram(word)
         if len(context) < 1: return p_uni
         
-        p_bi = self.bigram_probability(word, context[-1])
+        p_bi = self._bigram(word, context[-1])
         
         if order == 2 or len(context) < 2:
             return 0.7 * p_bi + 0.3 * p_uni
             
-        p_tri = self.trigram_probability(word, context[-2], context[-1])
+        p_tri = self._trigram(word, context[-2:], p_bi)
         
         if order == 3 or len(context) < 3:
             return 0.5 * p_tri + 0.3 * p_bi + 0.2 * p_uni
             
         # 4-gram logic
-        p_four = self.fourgram_probability(word, context[-3], context[-2], context[-1])
+        p_four = self._fourgram(word, context[-3:], p_tri)
         return 0.4 * p_four + 0.3 * p_tri + 0.2 * p_bi + 0.1 * p_uni
     
     def sentence_probability(self, words: List[str], order: int = 3) -> float:
         if not words: return 0.0
+        # Lowercase each word once here instead of once per n-gram window it appears in
+        words = [w.lower() for w in words]
+        probability = self._interpolated_cached
+        log = math.log
         log_prob = 0.0
         for i, word in enumerate(words):
             # Grab up to 3 previous words for 4-gram context
-            context = words[max(0, i-3):i]
-            prob = self.interpolated_probability(word, context, order)
-            log_prob += math.log(max(prob, 1e-10))
+            context = tuple(words[max(0, i-3):i])
+            prob = probability(word, context, order)
+            log_prob += log(max(prob, 1e-10))
         return log_prob
     
     def perplexity(self, words: List[str], order: int = 3) -> float:
@@ -168,61 +249,115 @@ class NgramModel:
         log_prob = self.sentence_probability(words, order)
         return math.exp(-log_prob / len(words))
     
+    def _build_candidate_index(self) -> None:
+        """
+        SymSpell-style index over the training vocabulary: each word and each of its single
+        deletions -> those words. Built when training ends (never on the request path); words
+        added to the vocabulary later (the spell checker's dictionary) have no counts and are not indexed.
+        """
+        from app.utils.edit_distance import generate_deletes
+        
+        index = defaultdict(list)
+        for vocab_word in self.vocabulary:
+            index[vocab_word].append(vocab_word)
+            for deleted in generate_deletes(vocab_word):
+                index[deleted].append(vocab_word)
+        self._deletion_index = dict(index)
+    
     def get_word_candidates(self, word: str, context: List[str], max_candidates: int = 5, order: int = 3) -> List[Tuple[str, float]]:
-        from app.utils.edit_distance import generate_edits_1
+        from app.utils.edit_distance import generate_edits_1, generate_deletes, is_edit_1
         
         word = word.lower()
         candidates = {word}
         
-        # Simple edit distance 1
-        for edit in generate_edits_1(word):
-            if edit in self.vocabulary:
-                candidates.add(edit)
+        index = self._deletion_index
+        if index is None:
+            # Not trained/loaded yet (or unpickled): simple edit distance 1 over the vocabulary
+            candidates.update(generate_edits_1(word).intersection(self.vocabulary))
+        else:
+            # Any trained word one edit away shares the word itself or one of its
+            # deletions in the index; only those few are verified
+            for key in (word, *generate_deletes(word)):
+                for vocab_word in index.get(key, ()):
+                    if vocab_word not in candidates and is_edit_1(word, vocab_word):
+                        candidates.add(vocab_word)
         
-        scored = []
-        for cand in candidates:
-            prob = self.interpolated_probability(cand, context, order)
-            scored.append((cand, prob))
+        # Candidates are lowercase already; normalize the shared context once for all of them
+        context_key = tuple(c.lower() for c in context[-3:])
+        probability = self._interpolated_cached
+        scored = [(cand, probability(cand, context_key, order)) for cand in candidates]
         
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:max_candidates]
+        # Partial top-k selection; same order as a full descending sort truncated to k
+        return heapq.nlargest(max_candidates, scored, key=lambda x: x[1])
 
     def save(self, filepath: str) -> None:
         with open(filepath, 'wb') as f:
             pickle.dump({
                 'unigram': self.unigram_counts,
-                'bigram': dict(self.bigram_counts),
-                'trigram': dict(self.trigram_counts),
-                'fourgram': dict(self.fourgram_counts),
+                # Tables are pickled as they are (no dict() copy); load() uses them directly
+                'bigram': self.bigram_counts,
+                'trigram': self.trigram_counts,
+                'fourgram': self.fourgram_counts,
                 'vocab': self.vocabulary,
                 'total': self.total_words
-            }, f)
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load(self, filepath: str) -> None:
         with open(filepath, 'rb') as f:
             data = pickle.load(f)
         self.unigram_counts = data['unigram']
-        self.bigram_counts = defaultdict(Counter, data['bigram'])
-        self.trigram_counts = defaultdict(Counter, data['trigram'])
-        self.fourgram_counts = defaultdict(Counter, data.get('fourgram', {})) # Backward compat
+        self.bigram_counts = _as_count_table(data['bigram'])
+        self.trigram_counts = _as_count_table(data['trigram'])
+        self.fourgram_counts = _as_count_table(data.get('fourgram', {})) # Backward compat
         self.vocabulary = data['vocab']
         self.total_words = data['total']
         self._trained = True
+        self._index_counts()
+
+def _as_count_table(table: Dict) -> Dict:
+    """Loaded n-gram table as a defaultdict(Counter); files saved as plain dicts are wrapped (one copy)."""
+    if isinstance(table, defaultdict) and table.default_factory is Counter:
+        return table
+    return defaultdict(Counter, table)
+
+# NLTK corpora the startup model is trained on, one worker process each
+_TRAINING_CORPORA = ('brown', 'gutenberg')
+
+def _train_on_corpus(name: str) -> NgramModel:
+    """Worker: train a partial model on one NLTK corpus."""
+    from nltk import corpus
+    model = NgramModel()
+    model.train(list(getattr(corpus, name).sents()))
+    return model
 
 _model = None
+_model_lock = threading.Lock()
 def get_model():
     global _model
-    if _model is None: _model = NgramModel()
+    # Double-checked so concurrent first calls share one model
+    if _model is None:
+        with _model_lock:
+            if _model is None: _model = NgramModel()
     return _model
 
 def initialize_model():
     global _model
     model = NgramModel()
     import nltk
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
     try:
-        from nltk.corpus import brown, gutenberg
-        model.train(list(brown.sents()))
-        model.train(list(gutenberg.sents()))
+        try:
+            # Corpora are counted in parallel, then merged in order
+            with ProcessPoolExecutor(max_workers=len(_TRAINING_CORPORA)) as pool:
+                for part in pool.map(_train_on_corpus, _TRAINING_CORPORA):
+                    model.merge(part)
+        except (BrokenProcessPool, OSError, MemoryError, pickle.PicklingError) as e:
+            # Pool could not run (spawning restricted, worker died): train in-process instead
+            print(f"Parallel training unavailable ({e!r}); training sequentially")
+            model = NgramModel()
+            for name in _TRAINING_CORPORA:
+                model.merge(_train_on_corpus(name))
         print(f"Model trained. Vocab: {len(model.vocabulary)}")
     except Exception as e:
         print(f"Model training fallback: {e}")
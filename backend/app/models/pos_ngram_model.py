@@ -3,21 +3,28 @@ POS Tag N-gram Model module.
 """
 import re
 import math
-from collections import defaultdict
-from typing import List, Dict, Tuple
+import functools
+from collections import Counter
+from typing import List, Dict, Tuple, Optional
 
 try:
     import nltk
-    from nltk import pos_tag, word_tokenize
+    from nltk import pos_tag, pos_tag_sents, word_tokenize
     from nltk.corpus import brown
 except ImportError:
     nltk = None
 
+# Sentence boundaries: whitespace following terminal punctuation
+_SENT_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
 class POSNGramModel:
     # Stricter threshold (-5.0) catches unusual structures universally
     STRUCTURE_THRESHOLD = -5.0
     
-    INVALID_PATTERNS = {
+    # Tag sequences of recently checked sentences (tagging dominates checking cost)
+    TAG_CACHE_SIZE = 4096
+    
+    INVALID_PATTERNS = frozenset({
         ('DT', 'VB', 'NN'),
         ('DT', 'VBP', 'NN'),
         ('DT', 'VBZ', 'NN'),
@@ -26,15 +33,16 @@ class POSNGramModel:
         ('NN', 'NN', 'VBP'), # Cat Dog Eat
         ('VB', 'VB', 'VB'),
         ('PRP', 'NN', 'VBD'), # I cat went
-    }
+    })
     
     def __init__(self):
-        self.trigram_counts = defaultdict(int)
-        self.bigram_counts = defaultdict(int)
-        self.unigram_counts = defaultdict(int)
+        self.trigram_counts = Counter()
+        self.bigram_counts = Counter()
+        self.unigram_counts = Counter()
         self.total_unigrams = 0
         self.vocabulary_size = 0
         self.is_trained = False
+        self._tag_cached = functools.lru_cache(maxsize=self.TAG_CACHE_SIZE)(self._tag)
         self._ensure_nltk_resources()
         if not self._train_on_brown_corpus():
             self._train_on_builtin_patterns()
@@ -48,8 +56,9 @@ class POSNGramModel:
     def _train_on_brown_corpus(self) -> bool:
         if not nltk: return False
         try:
-            formatted = [" ".join(sent) for sent in brown.sents(categories=['news', 'editorial', 'reviews'])[:15000]]
-            self.train(formatted)
+            # Brown is already tokenized: tag all sentences in one batched tagger call
+            sents = list(brown.sents(categories=['news', 'editorial', 'reviews'])[:15000])
+            self.train_tagged(pos_tag_sents(sents))
             return True
         except: return False
 
@@ -61,26 +70,42 @@ class POSNGramModel:
             self._train_sentence(sent)
         self.is_trained = True
 
+    def train_tagged(self, tagged_sents: List[List[Tuple[str, str]]]):
+        """Train on sentences that are already POS-tagged, e.g. by nltk.pos_tag_sents."""
+        for tagged in tagged_sents:
+            self._count_tags(tuple(t for w, t in tagged))
+        self.is_trained = True
+
     def _train_sentence(self, sentence: str):
-        try: tags = [t for w, t in pos_tag(word_tokenize(sentence))]
-        except: return
-        tags = ['<S>', '<S>'] + tags + ['</S>']
-        for i in range(len(tags)):
-            if i >= 2 and i < len(tags)-1: 
-                self.unigram_counts[tags[i]] += 1
-                self.total_unigrams += 1
-            if i >= 1: self.bigram_counts[(tags[i-1], tags[i])] += 1
-            if i >= 2: self.trigram_counts[(tags[i-2], tags[i-1], tags[i])] += 1
+        tags = self._tag(sentence)
+        if tags is None: return
+        self._count_tags(tags)
+
+    def _count_tags(self, tags: Tuple[str, ...]):
+        tags = ('<S>', '<S>', *tags, '</S>')
+        # Whole-sentence Counter updates over shifted views of the padded tags
+        inner = tags[2:-1]
+        self.unigram_counts.update(inner)
+        self.total_unigrams += len(inner)
+        self.bigram_counts.update(zip(tags, tags[1:]))
+        self.trigram_counts.update(zip(tags, tags[1:], tags[2:]))
         self.vocabulary_size = len(self.unigram_counts)
 
+    def _tag(self, sentence: str) -> Optional[Tuple[str, ...]]:
+        """POS tags of a sentence, or None if tagging fails."""
+        try: return tuple(t for w, t in pos_tag(word_tokenize(sentence)))
+        except: return None
+
     def get_sentence_probability(self, sentence: str) -> float:
-        try: tags = [t for w, t in pos_tag(word_tokenize(sentence))]
-        except: return 0.0
+        tags = self._tag_cached(sentence)
+        if tags is None: return 0.0
+        return self._score_tags(tags)
+
+    def _score_tags(self, tags: Tuple[str, ...]) -> float:
         if len(tags) < 3: return -5.0
-        tags = ['<S>', '<S>'] + tags + ['</S>']
+        tags = ('<S>', '<S>', *tags, '</S>')
         log_prob = 0.0
-        for i in range(2, len(tags)):
-            tri = (tags[i-2], tags[i-1], tags[i])
+        for tri in zip(tags, tags[1:], tags[2:]):
             cnt = self.trigram_counts.get(tri, 0)
             bi_cnt = self.bigram_counts.get(tri[:2], 0)
             prob = (cnt + 0.5) / (bi_cnt + 0.5 * self.vocabulary_size) if bi_cnt else 0.0001
@@ -89,29 +114,40 @@ class POSNGramModel:
 
     def check_sentence(self, sentence: str) -> List[Dict]:
         errors = []
-        try: tags = [t for w, t in pos_tag(word_tokenize(sentence))]
-        except: return []
+        # Tagged once, shared by the pattern check and the score below
+        tags = self._tag_cached(sentence)
+        if tags is None: return []
         if len(tags) < 3: return []
         
         # Check patterns
-        tags_m = ['<S>', '<S>'] + tags + ['</S>']
-        for i in range(2, len(tags_m)):
-            tri = (tags_m[i-2], tags_m[i-1], tags_m[i])
+        tags_m = ('<S>', '<S>', *tags, '</S>')
+        # zip yields the trigram tuples directly (built in C, no per-position indexing)
+        for tri in zip(tags_m, tags_m[1:], tags_m[2:]):
             if tri in self.INVALID_PATTERNS:
                 errors.append({'type': 'structure', 'position': {'start': 0, 'end': len(sentence)}, 'original': sentence, 'suggestion': '[Review Structure]', 'explanation': 'Unusual sentence structure.', 'sentenceIndex': 0})
         
         # Check Score
-        score = self.get_sentence_probability(sentence)
+        score = self._score_tags(tags)
         if score < self.STRUCTURE_THRESHOLD and not errors:
              errors.append({'type': 'structure', 'position': {'start': 0, 'end': len(sentence)}, 'original': sentence, 'suggestion': '[Review Structure]', 'explanation': f'Unusual structure (Score: {score:.1f}).', 'sentenceIndex': 0})
         return errors
 
     def check_text(self, text: str) -> List[Dict]:
         errors = []
-        for i, sent in enumerate(re.split(r'(?<=[.!?])\s+', text)):
+        start = 0
+        # Boundary matches give each sentence's offset directly (no text.find re-scan)
+        ends = [(m.start(), m.end()) for m in _SENT_BOUNDARY.finditer(text)]
+        ends.append((len(text), len(text)))
+        for i, (end, next_start) in enumerate(ends):
+            sent = text[start:end]
             if len(sent.strip()) > 5:
                 errs = self.check_sentence(sent)
-                errors.extend(errs) 
+                for e in errs:
+                    e['position']['start'] += start
+                    e['position']['end'] += start
+                    e['sentenceIndex'] = i
+                errors.extend(errs)
+            start = next_start
         return errors
 
 _pos_ngram_model = None
@@ -119,6 +119,61 @@ def generate_edits_2(word: str, alphabet: str = 'abcdefghijklmnopqrstuvwxyz') ->
     return set(e2 for e1 in generate_edits_1(word, alphabet) for e2 in generate_edits_1(e1, alphabet))
 
 
+def generate_deletes(word: str) -> Set[str]:
+    """
+    Generate all strings obtained by deleting one character from the word.
+    
+    Args:
+        word: Input word
+        
+    Returns:
+        Set of single-deletion variants
+    """
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def is_edit_1(word: str, candidate: str, alphabet: str = 'abcdefghijklmnopqrstuvwxyz') -> bool:
+    """
+    Check whether candidate is in generate_edits_1(word, alphabet), without generating the set.
+    
+    Args:
+        word: Input word (lowercase)
+        candidate: String to test
+        alphabet: Characters allowed for insertions and replacements
+        
+    Returns:
+        True if candidate is one deletion, transposition, replacement or insertion away
+    """
+    n, m = len(word), len(candidate)
+    # Length of the common prefix
+    i = 0
+    while i < min(n, m) and word[i] == candidate[i]:
+        i += 1
+    
+    # Deletion of any character
+    if m == n - 1:
+        return word[i + 1:] == candidate[i:]
+    
+    # Insertion of an alphabet character
+    if m == n + 1:
+        return candidate[i] in alphabet and candidate[i + 1:] == word[i:]
+    
+    if m != n:
+        return False
+    
+    # The word itself: replacing a letter by itself, or swapping two equal neighbours
+    if i == n:
+        return any(c in alphabet for c in word) or any(a == b for a, b in zip(word, word[1:]))
+    
+    # Replacement with an alphabet character
+    if word[i + 1:] == candidate[i + 1:]:
+        return candidate[i] in alphabet
+    
+    # Adjacent transposition
+    return (i + 1 < n and word[i] == candidate[i + 1] and word[i + 1] == candidate[i]
+            and word[i + 2:] == candidate[i + 2:])
+
+
 def get_candidates_within_distance(
     word: str,
     vocabulary: Set[str],
@@ -136,7 +191,6 @@ def get_candidates_within_distance(
         List of (candidate, distance) tuples sorted by distance
     """
     word = word.lower()
-    candidates = []
     
     # Check exact match first
     if word in vocabulary:
@@ -144,9 +198,7 @@ def get_candidates_within_distance(
     
     # Check edit distance 1
     edits1 = generate_edits_1(word)
-    for edit in edits1:
-        if edit in vocabulary:
-            candidates.append((edit, 1))
+    candidates = [(edit, 1) for edit in edits1.intersection(vocabulary)]
     
     # If we found candidates at distance 1, return them
     if candidates:
@@ -154,9 +206,11 @@ def get_candidates_within_distance(
     
     # Check edit distance 2 if needed
     if max_distance >= 2:
-        edits2 = generate_edits_2(word)
-        for edit in edits2:
-            if edit in vocabulary:
-                candidates.append((edit, 2))
+        # Expand one distance-1 edit at a time rather than materializing the
+        # whole distance-2 set, which grows quadratically with word length
+        edits2_hits = set()
+        for edit1 in edits1:
+            edits2_hits.update(generate_edits_1(edit1).intersection(vocabulary))
+        candidates = [(edit, 2) for edit in edits2_hits]
     
     return sorted(candidates, key=lambda x: x[1])
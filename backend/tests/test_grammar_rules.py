@@ -0,0 +1,28 @@
+from app.models.grammar_rules import GrammarRulesChecker
+
+
+def _flagged(text):
+    return [(e['original'], e['suggestion']) for e in GrammarRulesChecker().check_text(text)]
+
+
+def test_regularized_past_flags_irregular_verb():
+    assert ('knowed', 'knew') in _flagged('He knowed it.')
+
+
+def test_regularized_past_ignores_real_ed_words():
+    for text in ('They wined it.', 'They needed it.', 'I planed the board.', 'She putted well.'):
+        assert not any(original.endswith('ed') for original, _ in _flagged(text)), text
+
+
+def test_regularized_past_handles_short_doubled_tokens():
+    assert _flagged('This pped thing.') == []
+    assert _flagged('This dded and nned.') == []
+
+
+def test_overlapping_spans_keep_rule_order():
+    # Both fixes start at 'explain'; the earlier rule (the longer span) must come first
+    errors = GrammarRulesChecker().check_text('Yesterday I explain him the rule.')
+    assert [(e['original'], e['suggestion']) for e in errors][:2] == [
+        ('explain him', 'explain to him'),
+        ('explain', 'explained'),
+    ]